@@ -58,6 +58,7 @@ import os
 import struct
 import time
 import threading
+from array import array
 from PyQt6.QtWidgets import QApplication, QMainWindow, QFileDialog, QVBoxLayout, QWidget, QMenuBar, QMenu, QStatusBar, QListWidget, QLabel
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPixmap, QImage
@@ -725,51 +726,53 @@ class RSPProcessor:
 
     def read_register(self, address):
         """Read RSP register"""
-        reg = (address >> 12) & 0xF
-        if reg == 0x0:  # SP_MEM_ADDR
-            return 0x04000000
-        elif reg == 0x1:  # SP_DRAM_ADDR
-            return 0x04001000
-        elif reg == 0x2:  # SP_RD_LEN
-            return 0x00000000
-        elif reg == 0x3:  # SP_WR_LEN
-            return 0x00000000
-        elif reg == 0x4:  # SP_STATUS
-            return 0x00000001  # RSP halted
-        elif reg == 0x5:  # SP_DMA_FULL
-            return 0x00000000
-        elif reg == 0x6:  # SP_DMA_BUSY
-            return 0x00000000
-        elif reg == 0x7:  # SP_SEMAPHORE
-            return 0x00000000
-        elif reg == 0x8:  # SP_PC
-            return self.pc
-        elif reg == 0xB:  # SP_IMEM_START
-            return 0x04001000
-        elif reg == 0xC:  # SP_DMEM_START
-            return 0x04000000
-        return 0
+        match (address >> 12) & 0xF:
+            case 0x0:  # SP_MEM_ADDR
+                return 0x04000000
+            case 0x1:  # SP_DRAM_ADDR
+                return 0x04001000
+            case 0x2:  # SP_RD_LEN
+                return 0x00000000
+            case 0x3:  # SP_WR_LEN
+                return 0x00000000
+            case 0x4:  # SP_STATUS
+                return 0x00000001  # RSP halted
+            case 0x5:  # SP_DMA_FULL
+                return 0x00000000
+            case 0x6:  # SP_DMA_BUSY
+                return 0x00000000
+            case 0x7:  # SP_SEMAPHORE
+                return 0x00000000
+            case 0x8:  # SP_PC
+                return self.pc
+            case 0xB:  # SP_IMEM_START
+                return 0x04001000
+            case 0xC:  # SP_DMEM_START
+                return 0x04000000
+            case _:
+                return 0
 
     def write_register(self, address, value):
         """Write RSP register"""
-        reg = (address >> 12) & 0xF
-        if reg == 0x0:  # SP_MEM_ADDR
-            pass
-        elif reg == 0x1:  # SP_DRAM_ADDR
-            pass
-        elif reg == 0x2:  # SP_RD_LEN
-            # Trigger DMA read
-            pass
-        elif reg == 0x3:  # SP_WR_LEN
-            # Trigger DMA write
-            pass
-        elif reg == 0x8:  # SP_PC
-            self.pc = value & 0xFFF
+        match (address >> 12) & 0xF:
+            case 0x0:  # SP_MEM_ADDR
+                pass
+            case 0x1:  # SP_DRAM_ADDR
+                pass
+            case 0x2:  # SP_RD_LEN
+                # Trigger DMA read
+                pass
+            case 0x3:  # SP_WR_LEN
+                # Trigger DMA write
+                pass
+            case 0x8:  # SP_PC
+                self.pc = value & 0xFFF
 
 class RDPProcessor:
     """Reality Display Processor emulator"""
     def __init__(self):
-        self.framebuffer = bytearray(640 * 480 * 4)  # RGBA format
+        # One packed 0xAARRGGBB word per pixel, so a pixel write is a single store
+        self.framebuffer = array('I', [0]) * (640 * 480)
         self.commands = []
         self.status = 0
         self.start = 0
@@ -782,30 +785,31 @@ class RDPProcessor:
 
     def read_register(self, address):
         """Read RDP register"""
-        reg = address & 0xFF
-        if reg == 0x00:  # RDP_START
-            return self.start
-        elif reg == 0x04:  # RDP_END
-            return self.end
-        elif reg == 0x08:  # RDP_CURRENT
-            return self.current
-        elif reg == 0x0C:  # RDP_STATUS
-            return self.status
-        return 0
+        match address & 0xFF:
+            case 0x00:  # RDP_START
+                return self.start
+            case 0x04:  # RDP_END
+                return self.end
+            case 0x08:  # RDP_CURRENT
+                return self.current
+            case 0x0C:  # RDP_STATUS
+                return self.status
+            case _:
+                return 0
 
     def write_register(self, address, value):
         """Write RDP register"""
-        reg = address & 0xFF
-        if reg == 0x00:  # RDP_START
-            self.start = value
-        elif reg == 0x04:  # RDP_END
-            self.end = value
-            # Process commands when RDP_END is written
-            self.process_commands()
-        elif reg == 0x08:  # RDP_CURRENT
-            self.current = value
-        elif reg == 0x0C:  # RDP_STATUS
-            self.status = value
+        match address & 0xFF:
+            case 0x00:  # RDP_START
+                self.start = value
+            case 0x04:  # RDP_END
+                self.end = value
+                # Process commands when RDP_END is written
+                self.process_commands()
+            case 0x08:  # RDP_CURRENT
+                self.current = value
+            case 0x0C:  # RDP_STATUS
+                self.status = value
 
     def process_commands(self):
         """Process RDP command buffer"""
@@ -823,36 +827,37 @@ class AudioInterface:
 
     def read_register(self, address):
         """Read AI register"""
-        reg = address & 0xFF
-        if reg == 0x00:  # AI_DRAM_ADDR
-            return self.dram_addr
-        elif reg == 0x04:  # AI_LEN
-            return self.len
-        elif reg == 0x08:  # AI_CONTROL
-            return self.control
-        elif reg == 0x0C:  # AI_STATUS
-            return self.status
-        elif reg == 0x10:  # AI_DACRATE
-            return self.dacrate
-        elif reg == 0x14:  # AI_BITRATE
-            return self.bitrate
-        return 0
+        match address & 0xFF:
+            case 0x00:  # AI_DRAM_ADDR
+                return self.dram_addr
+            case 0x04:  # AI_LEN
+                return self.len
+            case 0x08:  # AI_CONTROL
+                return self.control
+            case 0x0C:  # AI_STATUS
+                return self.status
+            case 0x10:  # AI_DACRATE
+                return self.dacrate
+            case 0x14:  # AI_BITRATE
+                return self.bitrate
+            case _:
+                return 0
 
     def write_register(self, address, value):
         """Write AI register"""
-        reg = address & 0xFF
-        if reg == 0x00:  # AI_DRAM_ADDR
-            self.dram_addr = value
-        elif reg == 0x04:  # AI_LEN
-            self.len = value
-        elif reg == 0x08:  # AI_CONTROL
-            self.control = value
-        elif reg == 0x0C:  # AI_STATUS
-            self.status = value
-        elif reg == 0x10:  # AI_DACRATE
-            self.dacrate = value
-        elif reg == 0x14:  # AI_BITRATE
-            self.bitrate = value
+        match address & 0xFF:
+            case 0x00:  # AI_DRAM_ADDR
+                self.dram_addr = value
+            case 0x04:  # AI_LEN
+                self.len = value
+            case 0x08:  # AI_CONTROL
+                self.control = value
+            case 0x0C:  # AI_STATUS
+                self.status = value
+            case 0x10:  # AI_DACRATE
+                self.dacrate = value
+            case 0x14:  # AI_BITRATE
+                self.bitrate = value
 
 class VideoInterface:
     def __init__(self):
@@ -871,58 +876,59 @@ class VideoInterface:
 
     def read_register(self, address):
         """Read VI register"""
-        reg = address & 0xFF
-        if reg == 0x00:  # VI_STATUS
-            return (self.width << 16) | self.height
-        elif reg == 0x04:  # VI_ORIGIN
-            return self.origin
-        elif reg == 0x08:  # VI_WIDTH
-            return self.width
-        elif reg == 0x0C:  # VI_INTR
-            return self.v_intr
-        elif reg == 0x10:  # VI_CURRENT
-            return self.current
-        elif reg == 0x14:  # VI_BURST
-            return 0x00010001
-        elif reg == 0x18:  # VI_V_SYNC
-            return self.v_sync
-        elif reg == 0x1C:  # VI_H_SYNC
-            return self.h_sync
-        elif reg == 0x20:  # VI_LEAP
-            return self.leap
-        elif reg == 0x24:  # VI_H_START
-            return self.h_start
-        elif reg == 0x28:  # VI_V_START
-            return 0x00000200
-        elif reg == 0x2C:  # VI_V_BURST
-            return 0x000C000C
-        elif reg == 0x30:  # VI_X_SCALE
-            return self.x_scale
-        elif reg == 0x34:  # VI_Y_SCALE
-            return 0x00000400
-        return 0
+        match address & 0xFF:
+            case 0x00:  # VI_STATUS
+                return (self.width << 16) | self.height
+            case 0x04:  # VI_ORIGIN
+                return self.origin
+            case 0x08:  # VI_WIDTH
+                return self.width
+            case 0x0C:  # VI_INTR
+                return self.v_intr
+            case 0x10:  # VI_CURRENT
+                return self.current
+            case 0x14:  # VI_BURST
+                return 0x00010001
+            case 0x18:  # VI_V_SYNC
+                return self.v_sync
+            case 0x1C:  # VI_H_SYNC
+                return self.h_sync
+            case 0x20:  # VI_LEAP
+                return self.leap
+            case 0x24:  # VI_H_START
+                return self.h_start
+            case 0x28:  # VI_V_START
+                return 0x00000200
+            case 0x2C:  # VI_V_BURST
+                return 0x000C000C
+            case 0x30:  # VI_X_SCALE
+                return self.x_scale
+            case 0x34:  # VI_Y_SCALE
+                return 0x00000400
+            case _:
+                return 0
 
     def write_register(self, address, value):
         """Write VI register"""
-        reg = address & 0xFF
-        if reg == 0x04:  # VI_ORIGIN
-            self.origin = value
-        elif reg == 0x08:  # VI_WIDTH
-            self.width = value
-        elif reg == 0x0C:  # VI_INTR
-            self.v_intr = value
-        elif reg == 0x10:  # VI_CURRENT
-            self.current = value
-        elif reg == 0x18:  # VI_V_SYNC
-            self.v_sync = value
-        elif reg == 0x1C:  # VI_H_SYNC
-            self.h_sync = value
-        elif reg == 0x20:  # VI_LEAP
-            self.leap = value
-        elif reg == 0x24:  # VI_H_START
-            self.h_start = value
-        elif reg == 0x30:  # VI_X_SCALE
-            self.x_scale = value
+        match address & 0xFF:
+            case 0x04:  # VI_ORIGIN
+                self.origin = value
+            case 0x08:  # VI_WIDTH
+                self.width = value
+            case 0x0C:  # VI_INTR
+                self.v_intr = value
+            case 0x10:  # VI_CURRENT
+                self.current = value
+            case 0x18:  # VI_V_SYNC
+                self.v_sync = value
+            case 0x1C:  # VI_H_SYNC
+                self.h_sync = value
+            case 0x20:  # VI_LEAP
+                self.leap = value
+            case 0x24:  # VI_H_START
+                self.h_start = value
+            case 0x30:  # VI_X_SCALE
+                self.x_scale = value
 
 class PeripheralInterface:
     def __init__(self):
@@ -934,32 +940,33 @@ class PeripheralInterface:
 
     def read_register(self, address):
         """Read PI register"""
-        reg = address & 0xFF
-        if reg == 0x00:  # PI_DRAM_ADDR
-            return self.dram_addr
-        elif reg == 0x04:  # PI_CART_ADDR
-            return self.cart_addr
-        elif reg == 0x08:  # PI_RD_LEN
-            return self.rd_len
-        elif reg == 0x0C:  # PI_WR_LEN
-            return self.wr_len
-        elif reg == 0x10:  # PI_STATUS
-            return self.status | 0x02  # PI_STATUS_IO_BUSY = 0, PI_STATUS_ERROR = 0
-        return 0
+        match address & 0xFF:
+            case 0x00:  # PI_DRAM_ADDR
+                return self.dram_addr
+            case 0x04:  # PI_CART_ADDR
+                return self.cart_addr
+            case 0x08:  # PI_RD_LEN
+                return self.rd_len
+            case 0x0C:  # PI_WR_LEN
+                return self.wr_len
+            case 0x10:  # PI_STATUS
+                return self.status | 0x02  # PI_STATUS_IO_BUSY = 0, PI_STATUS_ERROR = 0
+            case _:
+                return 0
 
     def write_register(self, address, value):
         """Write PI register"""
-        reg = address & 0xFF
-        if reg == 0x00:  # PI_DRAM_ADDR
-            self.dram_addr = value
-        elif reg == 0x04:  # PI_CART_ADDR
-            self.cart_addr = value
-        elif reg == 0x08:  # PI_RD_LEN
-            self.rd_len = value
-        elif reg == 0x0C:  # PI_WR_LEN
-            self.wr_len = value
-        elif reg == 0x10:  # PI_STATUS
-            self.status = value
+        match address & 0xFF:
+            case 0x00:  # PI_DRAM_ADDR
+                self.dram_addr = value
+            case 0x04:  # PI_CART_ADDR
+                self.cart_addr = value
+            case 0x08:  # PI_RD_LEN
+                self.rd_len = value
+            case 0x0C:  # PI_WR_LEN
+                self.wr_len = value
+            case 0x10:  # PI_STATUS
+                self.status = value
 
 class SerialInterface:
     def __init__(self):
@@ -971,32 +978,33 @@ class SerialInterface:
 
     def read_register(self, address):
         """Read SI register"""
-        reg = address & 0xFF
-        if reg == 0x00:  # SI_DRAM_ADDR
-            return self.dram_addr
-        elif reg == 0x04:  # SI_PIF_ADDR
-            return self.pif_addr
-        elif reg == 0x08:  # SI_RD_LEN
-            return self.read_len
-        elif reg == 0x0C:  # SI_WR_LEN
-            return self.write_len
-        elif reg == 0x10:  # SI_STATUS
-            return self.status | 0x01  # SI_STATUS_BUSY = 0, SI_STATUS_ERROR = 0
-        return 0
+        match address & 0xFF:
+            case 0x00:  # SI_DRAM_ADDR
+                return self.dram_addr
+            case 0x04:  # SI_PIF_ADDR
+                return self.pif_addr
+            case 0x08:  # SI_RD_LEN
+                return self.read_len
+            case 0x0C:  # SI_WR_LEN
+                return self.write_len
+            case 0x10:  # SI_STATUS
+                return self.status | 0x01  # SI_STATUS_BUSY = 0, SI_STATUS_ERROR = 0
+            case _:
+                return 0
 
     def write_register(self, address, value):
         """Write SI register"""
-        reg = address & 0xFF
-        if reg == 0x00:  # SI_DRAM_ADDR
-            self.dram_addr = value
-        elif reg == 0x04:  # SI_PIF_ADDR
-            self.pif_addr = value
-        elif reg == 0x08:  # SI_RD_LEN
-            self.read_len = value
-        elif reg == 0x0C:  # SI_WR_LEN
-            self.write_len = value
-        elif reg == 0x10:  # SI_STATUS
-            self.status = value
+        match address & 0xFF:
+            case 0x00:  # SI_DRAM_ADDR
+                self.dram_addr = value
+            case 0x04:  # SI_PIF_ADDR
+                self.pif_addr = value
+            case 0x08:  # SI_RD_LEN
+                self.read_len = value
+            case 0x0C:  # SI_WR_LEN
+                self.write_len = value
+            case 0x10:  # SI_STATUS
+                self.status = value
 
 class EmuAI64Window(QMainWindow):
     def __init__(self):
@@ -1129,19 +1137,17 @@ class EmuAI64Window(QMainWindow):
                 # Create image from RDP framebuffer
                 image = QImage(width, height, QImage.Format.Format_RGB32)
 
+                # Bind the framebuffer and its length once, outside the pixel loops
+                fb = self.core.rdp.framebuffer
+                fblen = len(fb)
+
                 for y in range(min(height, 480)):  # Limit to display size
                     for x in range(min(width, 640)):
                         # Get pixel from RDP framebuffer (simplified)
-                        fb_index = (y * width + x) * 4
-                        if fb_index + 3 < len(self.core.rdp.framebuffer):
-                            r = self.core.rdp.framebuffer[fb_index]
-                            g = self.core.rdp.framebuffer[fb_index + 1]
-                            b = self.core.rdp.framebuffer[fb_index + 2]
-                            a = self.core.rdp.framebuffer[fb_index + 3]
-
-                            # Convert to RGB32 format
-                            color = (r << 16) | (g << 8) | b | (a << 24)
-                            image.setPixel(x, y, color)
+                        fb_index = y * width + x
+                        if fb_index < fblen:
+                            # Pixels are already packed in RGB32 (0xAARRGGBB) order
+                            image.setPixel(x, y, fb[fb_index])
                         else:
                             # Default pattern if no framebuffer data
                             r = (x * 255) // width
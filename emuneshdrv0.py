@@ -16,7 +16,8 @@ What is stubbed / partial:
   • APU: stub
 
 Run:
-  $ python3 program.py
+  $ python3 program.py [scale] [--gl]
+  (--gl presents frames in an OpenGL window; needs the moderngl and glfw packages)
   File → Open ROM… (choose a .nes) → View → CHR Tiles (default) or leave screen blank
   Hotkeys (prewired for future CPU loop):
     Arrows = D-Pad, Z = A, X = B, Right Shift = Select, Enter = Start
@@ -29,19 +30,129 @@ import struct
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the CHR viewer falls back to pure Python
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy/pure Python paths are used without it
+    njit = None
+
+try:
+    from PIL import Image, ImageTk
+except ImportError:  # Pillow is optional; frames go through Tk's own PPM path without it
+    Image = ImageTk = None
+
+try:
+    import glfw
+    import moderngl
+except ImportError:  # OpenGL presentation (--gl) is optional
+    glfw = moderngl = None
+
 NES_WIDTH  = 256
 NES_HEIGHT = 240
 
-def rgb(r, g, b) -> str:
-    return f"#{r:02x}{g:02x}{b:02x}"
-
 # Simple 2-bit grayscale for tile viewer (placeholder for real NES palette)
-PALETTE_GRAY = [
-    rgb(0, 0, 0),
-    rgb(96, 96, 96),
-    rgb(192, 192, 192),
-    rgb(255, 255, 255),
+PALETTE_RGB = [
+    (0, 0, 0),
+    (96, 96, 96),
+    (192, 192, 192),
+    (255, 255, 255),
 ]
+# Packed 3-byte RGB value for each 2-bit palette index
+PALETTE_BYTES = [bytes(c) for c in PALETTE_RGB]
+
+# Binary PPM (P6) header for a full frame; header + RGB framebuffer is a valid image
+PPM_HEADER = b"P6\n%d %d\n255\n" % (NES_WIDTH, NES_HEIGHT)
+
+# _NIBBLE_RGB[lo][hi] -> 4 RGB pixels (MSB left) for a low/high bitplane nibble pair
+_NIBBLE_RGB = [
+    [b"".join(PALETTE_BYTES[((lo >> (3 - i)) & 1) | (((hi >> (3 - i)) & 1) << 1)] for i in range(4))
+     for hi in range(16)]
+    for lo in range(16)
+]
+
+# RGB_ROW_LUT[(b0 << 8) | b1] -> one decoded tile row as 24 RGB bytes (8 pixels), from
+# low/high bitplane bytes b0 and b1: bit extraction, palette index and RGB expansion
+# fused into a single lookup. Only the pure-Python decoder needs it (65536 x 24 bytes).
+RGB_ROW_LUT = [
+    _NIBBLE_RGB[b0 >> 4][b1 >> 4] + _NIBBLE_RGB[b0 & 15][b1 & 15]
+    for b0 in range(256) for b1 in range(256)
+] if np is None else None
+
+# (4, 3) uint8 palette for fancy-indexed RGB expansion
+PALETTE_LUT = np.array(PALETTE_RGB, dtype=np.uint8) if np is not None else None
+
+def render_chr_numpy(chr_np) -> bytes:
+    """Decode CHR bitplanes into a 256x240 RGB tile grid with NumPy.
+    Tiles wrap if there are fewer than 960 of them.
+    """
+    tiles = chr_np[:(chr_np.size // 16) * 16].reshape(-1, 16)
+    p0 = np.unpackbits(tiles[:, :8], axis=1).reshape(-1, 8, 8)
+    p1 = np.unpackbits(tiles[:, 8:], axis=1).reshape(-1, 8, 8)
+    tile_pix = p0 | (p1 << 1)                      # (N, 8, 8) palette indices
+    grid = tile_pix[np.arange(32 * 30) % len(tile_pix)]
+    # (30, 32, 8, 8) -> (30, 8, 32, 8) -> (240, 256) so rows run left to right
+    indices = grid.reshape(30, 32, 8, 8).transpose(0, 2, 1, 3).reshape(NES_HEIGHT, NES_WIDTH)
+    return PALETTE_LUT[indices].tobytes()
+
+if njit is not None:
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def render_chr_numba(chr_bytes, palette_rgb, out):
+        """Decode CHR bitplanes straight into a flat 256x240 RGB buffer.
+        Same tile grid as render_chr_numpy, compiled, one tile row per prange step.
+        """
+        tile_count = chr_bytes.size // 16
+        for ty in prange(30):
+            # Pixel row outside tile column: each output line is written left to right
+            for row in range(8):
+                for tx in range(32):
+                    base = ((ty * 32 + tx) % tile_count) * 16
+                    b0 = chr_bytes[base + row]
+                    b1 = chr_bytes[base + 8 + row]
+                    off = ((ty * 8 + row) * NES_WIDTH + tx * 8) * 3
+                    for col in range(8):
+                        bit = 7 - col
+                        val = ((b0 >> bit) & 1) | (((b1 >> bit) & 1) << 1)
+                        o = off + col * 3
+                        out[o] = palette_rgb[val, 0]
+                        out[o + 1] = palette_rgb[val, 1]
+                        out[o + 2] = palette_rgb[val, 2]
+else:
+    render_chr_numba = None
+
+def render_chr_python(tiles) -> bytes:
+    """Pure-Python fallback: decode CHR into a 256x240 RGB tile grid."""
+    tile_count = len(tiles) // 16
+    # Global used in the inner loop, bound once as a local
+    lut = RGB_ROW_LUT
+    out = []
+    # Walk (tile row, pixel row, tile column) so output is produced strictly
+    # left to right, top to bottom, and the framebuffer is one sequential stream
+    for ty in range(30):
+        # Offset of each tile in this tile row (16 bytes per tile, 2 bitplanes)
+        bases = [((ty * 32 + tx) % tile_count) * 16 for tx in range(32)]
+        for row in range(8):
+            # Decode 8 pixels from two bitplanes (MSB left) straight to RGB
+            out.extend([lut[(tiles[base + row] << 8) | tiles[base + 8 + row]] for base in bases])
+    return b"".join(out)
+
+def build_chr_view(chr_data) -> bytes:
+    """Render CHR patterns as a 32x30 tile grid (fills full 256x240), as RGB bytes.
+    Tiles wrap if there are fewer than 960 of them. Uses the fastest available backend.
+    """
+    if len(chr_data) < 16:  # 16 bytes per 8x8 tile (2 bitplanes)
+        return PALETTE_BYTES[0] * (NES_WIDTH * NES_HEIGHT)
+    if np is None:
+        return render_chr_python(chr_data)
+    chr_np = np.frombuffer(chr_data, dtype=np.uint8)
+    if render_chr_numba is not None:
+        out = np.empty(NES_WIDTH * NES_HEIGHT * 3, dtype=np.uint8)
+        render_chr_numba(chr_np, PALETTE_LUT, out)
+        return out.tobytes()
+    return render_chr_numpy(chr_np)
 
 # -----------------------------
 # Cartridge & Mapper 0 (NROM)
@@ -59,8 +170,14 @@ class Cartridge:
         self.chr = bytearray()
         self.chr_is_ram = False
         self.prg_ram = bytearray(8 * 1024)  # default if header byte is 0
+        self.bus = None  # set by Bus so CHR writes can mark the PPU dirty
+        self.chr_view_cache = None  # decoded CHR tile view (RGB bytes); None = stale
         self.prg_banks = 0
         self.chr_banks = 0
+        self.prg_mask = 0x7FFF  # CPU address mask into prg_rom, set at load
+        # Read-side memoryviews over prg_rom/chr for the hot CPU/PPU read paths
+        self._prg_mv = memoryview(self.prg_rom)
+        self._chr_mv = memoryview(self.chr)
         self.ines2 = False
 
     @staticmethod
@@ -98,6 +215,9 @@ class Cartridge:
                 raise ValueError("Header says trainer present but file is too small.")
             offset += 512  # skip trainer
 
+        if prg_count == 0:
+            raise ValueError("Header declares no PRG ROM banks.")
+
         prg_size = prg_count * 16 * 1024
         chr_size = chr_count * 8 * 1024
 
@@ -105,6 +225,8 @@ class Cartridge:
             raise ValueError("File too small for declared PRG/CHR sizes.")
 
         c.prg_rom = bytearray(data[offset:offset+prg_size])
+        # Mirror a 16KB bank across $8000-$FFFF; 32KB (or more) maps straight through
+        c.prg_mask = 0x3FFF if prg_count == 1 else 0x7FFF
         offset += prg_size
 
         if chr_size == 0:
@@ -115,37 +237,36 @@ class Cartridge:
             c.chr_is_ram = False
             c.chr = bytearray(data[offset:offset+chr_size])
 
+        c._prg_mv = memoryview(c.prg_rom)
+        c._chr_mv = memoryview(c.chr)
+        # CHR ROM never changes, so its tile view is decoded once here
+        c.chr_view_cache = build_chr_view(c.chr)
+
         return c
 
     # CPU PRG ROM read mapping (Mapper 0)
     def cpu_read(self, addr: int) -> int:
-        if addr < 0x8000 or addr > 0xFFFF:
+        if addr < 0x8000:
             return 0x00
-        index = addr - 0x8000
-        if self.prg_banks == 1:
-            # Mirror 16KB bank across 32KB space
-            index %= 0x4000
-        if index < len(self.prg_rom):
-            return self.prg_rom[index]
-        return 0x00
+        # $8000 is bit 15, so masking alone gives the offset into PRG ROM
+        return self._prg_mv[addr & self.prg_mask]
 
     def cpu_write(self, addr: int, value: int):
         # Mapper 0 has no PRG registers; ignore writes to ROM space.
         pass
 
     # PPU Pattern table (CHR) read/write
+    # CHR is always at least 8KB (ROM banks or the default CHR RAM), so no bounds check
     def chr_read(self, addr: int) -> int:
-        addr &= 0x1FFF
-        if addr < len(self.chr):
-            return self.chr[addr]
-        return 0
+        return self._chr_mv[addr & 0x1FFF]
 
     def chr_write(self, addr: int, value: int):
         if not self.chr_is_ram:
             return
-        addr &= 0x1FFF
-        if addr < len(self.chr):
-            self.chr[addr] = value & 0xFF
+        self.chr[addr & 0x1FFF] = value & 0xFF
+        self.chr_view_cache = None
+        if self.bus is not None:
+            self.bus.ppu.chr_dirty = True
 
 # -----------------------------
 # Bus (CPU memory map, controllers, PPU regs)
@@ -153,7 +274,10 @@ class Cartridge:
 class Bus:
     def __init__(self, cartridge: Cartridge | None):
         self.cartridge = cartridge
+        if cartridge is not None:
+            cartridge.bus = self
         self.cpu_ram = bytearray(2 * 1024)  # $0000-$07FF, mirrored through $1FFF
+        self._ram_mv = memoryview(self.cpu_ram)
         self.ppu = PPU(self)                # PPU needs bus/cartridge access
         self.apu = APUStub()
         # NES controllers: bits A, B, Select, Start, Up, Down, Left, Right
@@ -161,6 +285,7 @@ class Bus:
         self.controller_shift = [0, 0]
         self.controller_state = [0, 0]
         self.controller_strobe = 0
+        self._build_dispatch_tables()
 
     def set_controller_bit(self, pad: int, bit_index: int, pressed: bool):
         if not (0 <= pad <= 1):
@@ -172,14 +297,31 @@ class Bus:
             self.controller_state[pad] &= ~mask
 
     # CPU read/write (simplified)
+    # One handler per 4KB page, indexed by addr >> 12:
+    #   $0000-$1FFF RAM | $2000-$3FFF PPU regs | $4000-$7FFF APU/IO | $8000-$FFFF cartridge
     def cpu_read(self, addr: int) -> int:
+        return self._read_table[(addr >> 12) & 0xF](addr)
+
+    def cpu_write(self, addr: int, value: int):
+        self._write_table[(addr >> 12) & 0xF](addr, value)
+
+    def _build_dispatch_tables(self):
+        if self.cartridge is not None:
+            read_cart, write_cart = self._read_cart, self._write_cart
+        else:
+            read_cart, write_cart = self._read_open, self._write_open
+        self._read_table = [self._read_ram] * 2 + [self._read_ppu] * 2 + [self._read_io] * 4 + [read_cart] * 8
+        self._write_table = [self._write_ram] * 2 + [self._write_ppu] * 2 + [self._write_io] * 4 + [write_cart] * 8
+
+    def _read_ram(self, addr: int) -> int:
+        return self._ram_mv[addr & 0x07FF]
+
+    def _read_ppu(self, addr: int) -> int:
+        return self.ppu.cpu_read(0x2000 + (addr & 7))
+
+    def _read_io(self, addr: int) -> int:
         addr &= 0xFFFF
-        if addr <= 0x1FFF:
-            return self.cpu_ram[addr & 0x07FF]
-        elif 0x2000 <= addr <= 0x3FFF:
-            reg = 0x2000 + (addr & 7)
-            return self.ppu.cpu_read(reg)
-        elif addr == 0x4016:
+        if addr == 0x4016:
             # Controller 1
             val = (self.controller_shift[0] & 1)
             self.controller_shift[0] >>= 1
@@ -189,23 +331,24 @@ class Bus:
             val = (self.controller_shift[1] & 1)
             self.controller_shift[1] >>= 1
             return 0x40 | val
-        elif addr >= 0x8000:
-            if self.cartridge is None:
-                return 0
-            return self.cartridge.cpu_read(addr)
-        else:
-            # APU/IO not implemented; return 0
-            return 0
+        # APU/IO not implemented; return 0
+        return 0
 
-    def cpu_write(self, addr: int, value: int):
+    def _read_cart(self, addr: int) -> int:
+        return self.cartridge.cpu_read(addr & 0xFFFF)
+
+    def _read_open(self, addr: int) -> int:
+        return 0
+
+    def _write_ram(self, addr: int, value: int):
+        self._ram_mv[addr & 0x07FF] = value & 0xFF
+
+    def _write_ppu(self, addr: int, value: int):
+        self.ppu.cpu_write(0x2000 + (addr & 7), value & 0xFF)
+
+    def _write_io(self, addr: int, value: int):
         addr &= 0xFFFF
-        value &= 0xFF
-        if addr <= 0x1FFF:
-            self.cpu_ram[addr & 0x07FF] = value
-        elif 0x2000 <= addr <= 0x3FFF:
-            reg = 0x2000 + (addr & 7)
-            self.ppu.cpu_write(reg, value)
-        elif addr == 0x4014:
+        if addr == 0x4014:
             # OAM DMA (stub)
             pass
         elif addr == 0x4016:
@@ -215,11 +358,13 @@ class Bus:
                 # Latch current controller states into shift registers
                 self.controller_shift[0] = self.controller_state[0]
                 self.controller_shift[1] = self.controller_state[1]
-        elif addr >= 0x8000 and self.cartridge is not None:
-            self.cartridge.cpu_write(addr, value)
-        else:
-            # APU/IO (stub)
-            pass
+        # else: APU/IO (stub)
+
+    def _write_cart(self, addr: int, value: int):
+        self.cartridge.cpu_write(addr & 0xFFFF, value & 0xFF)
+
+    def _write_open(self, addr: int, value: int):
+        pass
 
 # -----------------------------
 # PPU (stub + CHR tile viewer)
@@ -228,8 +373,13 @@ class PPU:
     def __init__(self, bus: Bus):
         self.bus = bus
         self.cartridge = bus.cartridge
-        self.framebuffer = [[PALETTE_GRAY[0] for _ in range(NES_WIDTH)] for _ in range(NES_HEIGHT)]
+        # Flat row-major RGB framebuffer (3 bytes per pixel)
+        self.framebuffer = bytearray(NES_WIDTH * NES_HEIGHT * 3)
         self.display_mode = "CHR"  # "CHR" or "BLANK"
+        # chr_dirty: CHR data or display mode changed, framebuffer must be re-rendered
+        # fb_dirty:  framebuffer changed since it was last pushed to the screen
+        self.chr_dirty = True
+        self.fb_dirty = True
         # Registers (stub)
         self.ppuctrl = 0
         self.ppumask = 0
@@ -270,60 +420,29 @@ class PPU:
         # ignore the rest for this skeleton
 
     def render_blank(self):
-        c = PALETTE_GRAY[0]
-        for y in range(NES_HEIGHT):
-            row = self.framebuffer[y]
-            for x in range(NES_WIDTH):
-                row[x] = c
+        self.framebuffer[:] = PALETTE_BYTES[0] * (NES_WIDTH * NES_HEIGHT)
 
     def render_chr_view(self):
-        """Render CHR patterns as a 32x30 tile grid (fills full 256x240).
-        Tiles wrap if cartridge has fewer than 960 tiles.
-        """
-        if self.cartridge is None:
-            self.render_blank()
-            return
-        tiles = self.cartridge.chr
-        if not tiles:
+        """Show the cartridge's CHR tile view (see build_chr_view)."""
+        cart = self.cartridge
+        if cart is None:
             self.render_blank()
             return
-
-        tile_count = len(tiles) // 16  # 16 bytes per 8x8 tile (2 bitplanes)
-        if tile_count == 0:
-            self.render_blank()
-            return
-
-        # Iterate screen in tile space 32x30
-        for ty in range(30):
-            for tx in range(32):
-                tile_index = (ty * 32 + tx) % tile_count
-                base = tile_index * 16
-                plane0 = tiles[base      : base + 8]
-                plane1 = tiles[base + 8  : base + 16]
-                # Draw this tile at (tx*8, ty*8)
-                dst_y = ty * 8
-                for row in range(8):
-                    b0 = plane0[row]
-                    b1 = plane1[row]
-                    py = dst_y + row
-                    if py >= NES_HEIGHT:
-                        continue
-                    out_row = self.framebuffer[py]
-                    dst_x = tx * 8
-                    # Decode 8 pixels from two bitplanes (MSB left)
-                    for col in range(8):
-                        bit = 7 - col
-                        val = ((b0 >> bit) & 1) | (((b1 >> bit) & 1) << 1)
-                        color = PALETTE_GRAY[val]
-                        px = dst_x + col
-                        if px < NES_WIDTH:
-                            out_row[px] = color
+        if cart.chr_view_cache is None:
+            # CHR RAM was written since the last decode
+            cart.chr_view_cache = build_chr_view(cart.chr)
+        self.framebuffer[:] = cart.chr_view_cache
 
     def render_frame(self):
+        # The CHR view is static until CHR RAM is written or the mode changes
+        if not self.chr_dirty:
+            return
+        self.chr_dirty = False
         if self.display_mode == "CHR":
             self.render_chr_view()
         else:
             self.render_blank()
+        self.fb_dirty = True
 
 # -----------------------------
 # CPU 6502 (scaffold)
@@ -339,15 +458,14 @@ class CPU6502:
         self.p = 0x24   # IRQ disabled (I=1), unused bits set
         self.pc = 0xC000
 
-        # Simple instruction map (very incomplete, skeleton)
-        self.instructions = {
-            0xEA: self.NOP,
-            # Add more: A9 (LDA #imm), 8D (STA abs), 4C (JMP abs), etc.
-        }
+        # Flat 256-entry opcode table (very incomplete, skeleton); unknown opcodes act as NOP
+        dispatch = [self.NOP] * 256
+        dispatch[0xEA] = self.NOP
+        # Add more: A9 (LDA #imm), 8D (STA abs), 4C (JMP abs), etc.
+        self.dispatch = tuple(dispatch)
 
-    # Flag helpers
-    def set_z(self, v): self.p = (self.p & ~0x02) | (0x02 if v == 0 else 0)
-    def set_n(self, v): self.p = (self.p & ~0x80) | (0x80 if (v & 0x80) else 0)
+    # Flag helpers: Z and N updated together; N is bit 7 of the result, copied as-is
+    def set_zn(self, v): self.p = (self.p & ~0x82) | ((not (v & 0xFF)) << 1) | (v & 0x80)
 
     def reset(self):
         # Read reset vector at $FFFC/$FFFD
@@ -361,11 +479,13 @@ class CPU6502:
         """Execute a small number of instructions (stub)."""
         # For now we do nothing meaningful to keep UI responsive
         # Extend: fetch opcode, decode, execute, handle page crossings, cycles, etc.
+        # Bind the bus read and opcode table once; each iteration is fetch + indexed call
+        read = self.bus.cpu_read
+        dispatch = self.dispatch
         for _ in range(cycles):
-            opcode = self.bus.cpu_read(self.pc)
-            self.pc = (self.pc + 1) & 0xFFFF
-            handler = self.instructions.get(opcode, self.NOP)
-            handler()
+            pc = self.pc
+            self.pc = (pc + 1) & 0xFFFF
+            dispatch[read(pc)]()
 
     # --- Instructions (stubs)
     def NOP(self):
@@ -379,11 +499,92 @@ class APUStub:
     def __init__(self):
         pass
 
+# -----------------------------
+# OpenGL presenter (optional, --gl)
+# -----------------------------
+GL_VERTEX_SHADER = """
+#version 330
+in vec2 in_pos;
+out vec2 uv;
+void main() {
+    // Framebuffer row 0 is the top of the screen
+    uv = vec2((in_pos.x + 1.0) * 0.5, (1.0 - in_pos.y) * 0.5);
+    gl_Position = vec4(in_pos, 0.0, 1.0);
+}
+"""
+
+GL_FRAGMENT_SHADER = """
+#version 330
+uniform sampler2D frame;
+in vec2 uv;
+out vec4 color;
+void main() {
+    color = texture(frame, uv);
+}
+"""
+
+class GLBackend:
+    """Shows the RGB framebuffer as a 256x240 texture on a fullscreen quad,
+    so scaling happens on the GPU. The Tk window keeps the menus and input;
+    the app calls poll() on a timer so this window stays responsive even
+    when no new frame is coming.
+    """
+    def __init__(self, scale: int):
+        if not glfw.init():
+            raise RuntimeError("GLFW initialisation failed.")
+        glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 3)
+        glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 3)
+        glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_CORE_PROFILE)
+        glfw.window_hint(glfw.OPENGL_FORWARD_COMPAT, True)
+        self.window = glfw.create_window(NES_WIDTH*scale, NES_HEIGHT*scale, "TinyNES (GL)", None, None)
+        if not self.window:
+            glfw.terminate()
+            raise RuntimeError("Could not create an OpenGL 3.3 window.")
+        glfw.make_context_current(self.window)
+
+        self.ctx = moderngl.create_context()
+        self.texture = self.ctx.texture((NES_WIDTH, NES_HEIGHT), 3)
+        self.texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        prog = self.ctx.program(vertex_shader=GL_VERTEX_SHADER, fragment_shader=GL_FRAGMENT_SHADER)
+        vbo = self.ctx.buffer(struct.pack("8f", -1.0, -1.0, 1.0, -1.0, -1.0, 1.0, 1.0, 1.0))
+        self.quad = self.ctx.vertex_array(prog, [(vbo, "2f", "in_pos")])
+        self.size = glfw.get_framebuffer_size(self.window)
+
+    def present(self, fb):
+        """Upload a new frame and draw it"""
+        glfw.make_context_current(self.window)
+        self.texture.write(fb)  # one ~180KB upload, only for frames that changed
+        self.draw()
+
+    def draw(self):
+        """Draw the current texture to the window at its current size"""
+        glfw.make_context_current(self.window)
+        self.size = glfw.get_framebuffer_size(self.window)
+        self.ctx.viewport = (0, 0, *self.size)
+        self.texture.use(0)
+        self.ctx.clear()
+        self.quad.render(moderngl.TRIANGLE_STRIP)
+        glfw.swap_buffers(self.window)
+
+    def poll(self) -> bool:
+        """Pump window events, redrawing the last frame if the window was resized.
+        Returns False once the user has asked to close the window."""
+        glfw.poll_events()
+        if glfw.window_should_close(self.window):
+            return False
+        if glfw.get_framebuffer_size(self.window) != self.size:
+            self.draw()
+        return True
+
+    def close(self):
+        glfw.destroy_window(self.window)
+        glfw.terminate()
+
 # -----------------------------
 # UI App (Tkinter)
 # -----------------------------
 class NESEmuApp:
-    def __init__(self, scale: int = 3):
+    def __init__(self, scale: int = 3, use_gl: bool = False):
         self.root = tk.Tk()
         self.root.title("TinyNES (Skeleton) — program.py")
         self.scale = max(1, int(scale))
@@ -393,13 +594,25 @@ class NESEmuApp:
         self.cpu: CPU6502 | None = None
         self.running = False
         self.frame_interval_ms = int(1000 / 60)
-
-        # Canvas + image
-        self.canvas = tk.Canvas(self.root, width=NES_WIDTH*self.scale, height=NES_HEIGHT*self.scale, bd=0, highlightthickness=0)
-        self.canvas.pack()
-        self.photo = tk.PhotoImage(width=NES_WIDTH, height=NES_HEIGHT)
-        self.photo_scaled = self.photo.zoom(self.scale, self.scale)
-        self.image_id = self.canvas.create_image(0, 0, image=self.photo_scaled, anchor=tk.NW)
+        # Instructions per frame; a real core would run ~29,780 CPU cycles per NTSC frame
+        self.cpu_steps_per_frame = 100  # placeholder
+
+        # Frames go to the GL window when requested, otherwise to the Tk canvas below
+        self.gl = GLBackend(self.scale) if use_gl else None
+
+        # Canvas + image (not needed when the GL window shows the frames)
+        if self.gl is None:
+            self.canvas = tk.Canvas(self.root, width=NES_WIDTH*self.scale, height=NES_HEIGHT*self.scale, bd=0, highlightthickness=0)
+            self.canvas.pack()
+            if ImageTk is not None:
+                # Pillow wraps the framebuffer and scales it in C; frames are pasted in place
+                self.photo = None
+                self.photo_scaled = ImageTk.PhotoImage(Image.new("RGB", (NES_WIDTH*self.scale, NES_HEIGHT*self.scale)))
+            else:
+                self.photo = tk.PhotoImage(width=NES_WIDTH, height=NES_HEIGHT)
+                # Scaled image is created once; each frame is zoom-copied into it in place
+                self.photo_scaled = self.photo.zoom(self.scale, self.scale)
+            self.image_id = self.canvas.create_image(0, 0, image=self.photo_scaled, anchor=tk.NW)
 
         # Status bar
         self.status_var = tk.StringVar(value="Open a ROM via File → Open ROM…  |  View → CHR Tiles to see graphics")
@@ -451,6 +664,8 @@ class NESEmuApp:
             "Left":  (0, 6),
             "Right": (0, 7),
         }
+        # keysym -> (pad, bit mask), precomputed so on_key only touches controller_state
+        self._press_map = {k: (pad, 1 << bit) for k, (pad, bit) in self.keymap.items()}
         self.root.bind("<KeyPress>", self.on_key)
         self.root.bind("<KeyRelease>", self.on_key)
 
@@ -472,6 +687,7 @@ class NESEmuApp:
             self.bus.ppu.display_mode = "CHR"
         else:
             self.bus.ppu.display_mode = "BLANK"
+        self.bus.ppu.chr_dirty = True
 
     def status_info(self, text: str):
         self.status_var.set(text)
@@ -518,7 +734,7 @@ class NESEmuApp:
             self.status_info("Open a ROM first.")
             return
         self.running = True
-        self.loop()
+        self._frame()
 
     def pause(self):
         self.running = False
@@ -533,28 +749,43 @@ class NESEmuApp:
     def on_key(self, event):
         if self.bus is None:
             return
-        keysym = event.keysym
-        pressed = (event.type == "2")  # KeyPress event type
-        if keysym in self.keymap:
-            pad, bit = self.keymap[keysym]
-            self.bus.set_controller_bit(pad, bit, pressed)
+        entry = self._press_map.get(event.keysym)
+        if entry is None:
+            return
+        pad, mask = entry
+        state = self.bus.controller_state
+        if event.type == "2":  # KeyPress event type
+            state[pad] |= mask
+        else:
+            state[pad] &= ~mask
 
     # ----- Main emulation loop (skeleton)
-    def loop(self):
+    def _frame(self):
         if not self.running:
             return
-
-        # In a real emulator you'd run ~29,780 CPU cycles per NTSC frame here.
-        # We'll keep this skeleton light: step a tiny amount (no-ops) and paint.
+        start = time.perf_counter()
+        self._cpu_tick()
+        self._maybe_redraw()
+        # Subtract the time spent this frame so the CPU burst doesn't stretch the frame period
+        elapsed_ms = int((time.perf_counter() - start) * 1000)
+        self.root.after(max(1, self.frame_interval_ms - elapsed_ms), self._frame)
+
+    def _cpu_tick(self):
+        # Run a whole frame's worth of CPU work in one tight burst
         if self.cpu:
-            self.cpu.step(100)  # placeholder
+            self.cpu.step(self.cpu_steps_per_frame)
 
-        self.update_frame()
-        self.root.after(self.frame_interval_ms, self.loop)
+    def _maybe_redraw(self):
+        # Re-render/blit only when the PPU reports a change
+        ppu = self.bus.ppu
+        ppu.render_frame()
+        if ppu.fb_dirty:
+            self.blit_framebuffer_to_photo(ppu.framebuffer)
+            ppu.fb_dirty = False
 
     # ----- Rendering helpers
     def blank_framebuffer(self):
-        fb = [[PALETTE_GRAY[0] for _ in range(NES_WIDTH)] for _ in range(NES_HEIGHT)]
+        fb = PALETTE_BYTES[0] * (NES_WIDTH * NES_HEIGHT)
         self.blit_framebuffer_to_photo(fb)
 
     def update_frame(self):
@@ -562,36 +793,62 @@ class NESEmuApp:
             self.blank_framebuffer()
             return
         # Render one frame from PPU's current display mode
-        self.bus.ppu.render_frame()
-        self.blit_framebuffer_to_photo(self.bus.ppu.framebuffer)
+        self._maybe_redraw()
 
     def blit_framebuffer_to_photo(self, fb):
-        # Push framebuffer (list of list of "#RRGGBB") into Tk PhotoImage.
-        # For performance, we upload line-by-line.
-        for y in range(NES_HEIGHT):
-            # PhotoImage.put expects a tk color list string: "{#000000 #FFFFFF ...}"
-            row_str = " ".join(fb[y])
-            self.photo.put("{" + row_str + "}", to=(0, y))
+        if self.gl is not None:
+            self.gl.present(fb)
+            return
+
+        if ImageTk is not None:
+            # Zero-copy image over the framebuffer, nearest-neighbour scaled by Pillow
+            img = Image.frombuffer("RGB", (NES_WIDTH, NES_HEIGHT), fb, "raw", "RGB", 0, 1)
+            self.photo_scaled.paste(img.resize((NES_WIDTH*self.scale, NES_HEIGHT*self.scale), Image.NEAREST))
+            return
 
-        # Scale and display
-        self.photo_scaled = self.photo.zoom(self.scale, self.scale)
-        self.canvas.itemconfig(self.image_id, image=self.photo_scaled)
+        # Push flat RGB framebuffer into Tk PhotoImage.
+        # The whole frame goes up as one binary PPM blob in a single Tcl call,
+        # instead of 240 rows of "#RRGGBB" color strings for Tk to parse.
+        self.photo.put(PPM_HEADER + fb)
+
+        # Scale into the existing canvas image (Tk does the zoom in C, no new image per frame)
+        self.photo_scaled.tk.call(self.photo_scaled.name, "copy", self.photo.name,
+                                  "-zoom", self.scale, self.scale)
+
+    def _gl_tick(self):
+        # Keep the GL window's events flowing whether or not a ROM is running
+        if not self.gl.poll():
+            self.running = False
+            self.gl.close()
+            self.gl = None
+            self.root.quit()
+            return
+        self.root.after(self.frame_interval_ms, self._gl_tick)
 
     def run_app(self):
+        if self.gl is not None:
+            self.root.after(self.frame_interval_ms, self._gl_tick)
         self.root.mainloop()
+        if self.gl is not None:
+            self.gl.close()
 
 # -----------------------------
 # Entry point
 # -----------------------------
 def main():
-    # Optional: allow scale argument (e.g., python3 program.py 2)
+    # Optional: allow scale argument (e.g., python3 program.py 2) and --gl
+    args = [a for a in sys.argv[1:] if a != "--gl"]
+    use_gl = len(args) != len(sys.argv) - 1
+    if use_gl and moderngl is None:
+        print("--gl needs the moderngl and glfw packages; using the Tk backend.", file=sys.stderr)
+        use_gl = False
     scale = 3
-    if len(sys.argv) >= 2:
+    if args:
         try:
-            scale = max(1, int(sys.argv[1]))
+            scale = max(1, int(args[0]))
         except ValueError:
             pass
-    app = NESEmuApp(scale=scale)
+    app = NESEmuApp(scale=scale, use_gl=use_gl)
     app.run_app()
 
 if __name__ == "__main__":
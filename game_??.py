@@ -1,7 +1,9 @@
 import pygame
 import random
 import sys
+import numpy as np
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 # Initialize pygame
@@ -11,7 +13,11 @@ pygame.init()
 # Core data structures (unchanged from original)
 # ---------------------------
 
-Grid = List[List[str]]
+# 2D uint8 array (height x width); each cell holds the ord() of its tile character
+Grid = np.ndarray
+
+SPACE = np.uint8(ord(' '))
+WATER = np.uint8(ord('~'))
 
 @dataclass
 class EnemySpawn:
@@ -47,176 +53,177 @@ class LevelSpec:
 # ---------------------------
 
 def make_grid(w: int, h: int, fill: str = " ") -> Grid:
-    return [[fill for _ in range(w)] for _ in range(h)]
+    return np.full((h, w), ord(fill), dtype=np.uint8)
 
 def render_grid(grid: Grid) -> List[str]:
-    return ["".join(row) for row in grid]
+    # One copy + decode for the whole grid, then slice it into rows
+    w = grid.shape[1]
+    text = grid.tobytes().decode("latin-1")
+    return [text[i:i + w] for i in range(0, len(text), w)]
 
 def _stamp(grid: Grid, x: int, y: int, ch: str):
-    h = len(grid)
-    w = len(grid[0])
+    h, w = grid.shape
     if 0 <= x < w and 0 <= y < h:
-        grid[y][x] = ch
+        grid[y, x] = ord(ch)
 
 def _hline(grid: Grid, x0: int, x1: int, y: int, ch: str):
-    for x in range(min(x0, x1), max(x0, x1) + 1):
-        _stamp(grid, x, y, ch)
+    h, w = grid.shape
+    if 0 <= y < h:
+        grid[y, max(0, min(x0, x1)):max(0, max(x0, x1) + 1)] = ord(ch)
 
 def _vline(grid: Grid, x: int, y0: int, y1: int, ch: str):
-    for y in range(min(y0, y1), max(y0, y1) + 1):
-        _stamp(grid, x, y, ch)
-
-def chunk_flat(width: int) -> Tuple[Callable[[Grid, int, LevelSpec], None], int]:
-    def op(grid: Grid, x0: int, spec: LevelSpec):
-        y = spec.ground_y
-        for x in range(x0, x0 + width):
-            for yy in range(y, spec.height):
-                _stamp(grid, x, yy, 'X')
-    return op, width
-
-def chunk_pit(width: int, hazard: Optional[str] = None) -> Tuple[Callable[[Grid, int, LevelSpec], None], int]:
-    def op(grid: Grid, x0: int, spec: LevelSpec):
-        if hazard:
-            for x in range(x0, x0 + width):
-                for yy in range(spec.ground_y + 1, spec.height):
-                    _stamp(grid, x, yy, hazard)
-    return op, width
-
-def chunk_bridge(width: int) -> Tuple[Callable[[Grid, int, LevelSpec], None], int]:
-    def op(grid: Grid, x0: int, spec: LevelSpec):
-        pit_op, _ = chunk_pit(width, '~')
-        pit_op(grid, x0, spec)
-        _hline(grid, x0, x0 + width - 1, spec.ground_y, '=')
-    return op, width
-
-def chunk_pipe(height_blocks: int = 4, body_width: int = 2) -> Tuple[Callable[[Grid, int, LevelSpec], None], int]:
+    h, w = grid.shape
+    if 0 <= x < w:
+        grid[max(0, min(y0, y1)):max(0, max(y0, y1) + 1), x] = ord(ch)
+
+# Each stamper draws one chunk kind at column x0 and returns its width;
+# the chunk's args from LevelSpec.chunks follow as positional parameters.
+
+def _stamp_flat(grid: Grid, x0: int, spec: LevelSpec, width: int) -> int:
+    grid[spec.ground_y:spec.height, x0:x0 + width] = ord('X')
+    return width
+
+def _stamp_pit(grid: Grid, x0: int, spec: LevelSpec, width: int, hazard: Optional[str] = None) -> int:
+    if hazard:
+        grid[spec.ground_y + 1:spec.height, x0:x0 + width] = ord(hazard)
+    return width
+
+def _stamp_bridge(grid: Grid, x0: int, spec: LevelSpec, width: int) -> int:
+    grid[spec.ground_y + 1:spec.height, x0:x0 + width] = ord('~')
+    grid[spec.ground_y, x0:x0 + width] = ord('=')
+    return width
+
+def _stamp_pipe(grid: Grid, x0: int, spec: LevelSpec, height_blocks: int = 4, body_width: int = 2) -> int:
     w = body_width + 2
-    def op(grid: Grid, x0: int, spec: LevelSpec):
-        flat_op, _ = chunk_flat(w)
-        flat_op(grid, x0, spec)
-        top_y = max(0, spec.ground_y - height_blocks)
-        lx = x0 + 1
-        rx = lx + body_width - 1
-        for x in range(lx, rx + 1):
-            _vline(grid, x, top_y, spec.ground_y - 1, '|')
-        _hline(grid, lx - 1, rx + 1, top_y, '|')
-    return op, w
-
-def chunk_stairs_up(steps: int = 4, step_w: int = 2) -> Tuple[Callable[[Grid, int, LevelSpec], None], int]:
+    grid[spec.ground_y:spec.height, x0:x0 + w] = ord('X')
+    top_y = max(0, spec.ground_y - height_blocks)
+    lx = x0 + 1
+    rx = lx + body_width - 1
+    grid[min(top_y, spec.ground_y - 1):max(top_y, spec.ground_y - 1) + 1, lx:rx + 1] = ord('|')
+    _hline(grid, lx - 1, rx + 1, top_y, '|')
+    return w
+
+def _stamp_stairs_up(grid: Grid, x0: int, spec: LevelSpec, steps: int = 4, step_w: int = 2) -> int:
     w = steps * step_w
-    def op(grid: Grid, x0: int, spec: LevelSpec):
-        gy = spec.ground_y
-        flat_op, _ = chunk_flat(w)
-        flat_op(grid, x0, spec)
-        for s in range(steps):
-            height = s + 1
-            x_start = x0 + s * step_w
-            for x in range(x_start, x_start + step_w):
-                for y in range(gy - height + 1, gy + 1):
-                    _stamp(grid, x, y, 'X')
-    return op, w
-
-def chunk_stairs_down(steps: int = 4, step_w: int = 2) -> Tuple[Callable[[Grid, int, LevelSpec], None], int]:
+    gy = spec.ground_y
+    _stamp_flat(grid, x0, spec, w)
+    for s in range(steps):
+        height = s + 1
+        x_start = x0 + s * step_w
+        grid[max(0, gy - height + 1):gy + 1, x_start:x_start + step_w] = ord('X')
+    return w
+
+def _stamp_stairs_down(grid: Grid, x0: int, spec: LevelSpec, steps: int = 4, step_w: int = 2) -> int:
     w = steps * step_w
-    def op(grid: Grid, x0: int, spec: LevelSpec):
-        gy = spec.ground_y
-        flat_op, _ = chunk_flat(w)
-        flat_op(grid, x0, spec)
-        for s in range(steps):
-            height = steps - s
-            x_start = x0 + s * step_w
-            for x in range(x_start, x_start + step_w):
-                for y in range(gy - height + 1, gy + 1):
-                    _stamp(grid, x, y, 'X')
-    return op, w
-
-def chunk_platforms(width: int, spans: Sequence[Tuple[int, int]]) -> Tuple[Callable[[Grid, int, LevelSpec], None], int]:
-    def op(grid: Grid, x0: int, spec: LevelSpec):
-        flat_op, _ = chunk_flat(width)
-        flat_op(grid, x0, spec)
-        lanes = len(spans)
-        gap = max(3, (width - 4) // max(1, lanes))
-        x = x0 + 2
-        for (y, plen) in spans:
-            for xx in range(x, min(x + plen, x0 + width - 1)):
-                _stamp(grid, xx, y, 'X')
-            _stamp(grid, x + plen // 2, y + 1, 'M')
-            x += gap
-    return op, width
-
-def chunk_cave_ceiling(width: int, undulate: bool = True) -> Tuple[Callable[[Grid, int, LevelSpec], None], int]:
-    def op(grid: Grid, x0: int, spec: LevelSpec):
-        flat_op, _ = chunk_flat(width)
-        flat_op(grid, x0, spec)
-        for x in range(x0, x0 + width):
-            top = 2 + ((x - x0) % 3 if undulate else 0)
-            _hline(grid, x, x, top, 'X')
-    return op, width
-
-def chunk_airship(width: int) -> Tuple[Callable[[Grid, int, LevelSpec], None], int]:
-    def op(grid: Grid, x0: int, spec: LevelSpec):
-        deck_y = max(2, spec.ground_y - 3)
-        for x in range(x0, x0 + width):
-            _stamp(grid, x, deck_y, '=')
-            if (x - x0) % 11 == 0:
-                _stamp(grid, x, deck_y - 1, '^')
-        for x in range(x0, x0 + width, 5):
-            _vline(grid, x, deck_y + 1, min(spec.height - 1, deck_y + 3), 'X')
-    return op, width
+    gy = spec.ground_y
+    _stamp_flat(grid, x0, spec, w)
+    for s in range(steps):
+        height = steps - s
+        x_start = x0 + s * step_w
+        grid[max(0, gy - height + 1):gy + 1, x_start:x_start + step_w] = ord('X')
+    return w
+
+def _stamp_platforms(grid: Grid, x0: int, spec: LevelSpec, width: int, spans: Sequence[Tuple[int, int]]) -> int:
+    _stamp_flat(grid, x0, spec, width)
+    lanes = len(spans)
+    gap = max(3, (width - 4) // max(1, lanes))
+    x = x0 + 2
+    for (y, plen) in spans:
+        end = min(x + plen, x0 + width - 1)
+        if end > x:
+            _hline(grid, x, end - 1, y, 'X')
+        _stamp(grid, x + plen // 2, y + 1, 'M')
+        x += gap
+    return width
+
+def _stamp_cave_ceiling(grid: Grid, x0: int, spec: LevelSpec, width: int, undulate: bool = True) -> int:
+    _stamp_flat(grid, x0, spec, width)
+    cols = np.arange(width)
+    tops = 2 + (cols % 3 if undulate else 0)
+    grid[tops, x0 + cols] = ord('X')
+    return width
+
+def _stamp_airship(grid: Grid, x0: int, spec: LevelSpec, width: int) -> int:
+    deck_y = max(2, spec.ground_y - 3)
+    grid[deck_y, x0:x0 + width] = ord('=')
+    grid[deck_y - 1, x0:x0 + width:11] = ord('^')
+    grid[deck_y + 1:min(spec.height - 1, deck_y + 3) + 1, x0:x0 + width:5] = ord('X')
+    return width
+
+_CHUNK_OPS: Dict[str, Callable[..., int]] = {
+    "flat": _stamp_flat,
+    "pit": _stamp_pit,
+    "bridge": _stamp_bridge,
+    "pipe": _stamp_pipe,
+    "stairs_up": _stamp_stairs_up,
+    "stairs_down": _stamp_stairs_down,
+    "platforms": _stamp_platforms,
+    "cave": _stamp_cave_ceiling,
+    "airship": _stamp_airship,
+}
 
 # ---------------------------
 # Level building (unchanged from original)
 # ---------------------------
 
+def _pack_spec(spec: LevelSpec):
+    """Pack coins, items and enemies into flat grid indices (plus item tile bytes).
+
+    Off-grid points are dropped here, as _stamp would, so building a level
+    is just three stores into grid.ravel().  The result is cached on the spec.
+    """
+    packed = getattr(spec, "_packed", None)
+    if packed is None:
+        w, h = spec.width, spec.height
+        def flat(points, values=None):
+            idx = np.array([y * w + x for (x, y) in points], dtype=np.int32)
+            keep = np.array([0 <= x < w and 0 <= y < h for (x, y) in points], dtype=bool)
+            if values is None:
+                return idx[keep]
+            return idx[keep], np.asarray(values, dtype=np.uint8)[keep]
+        coins = flat(spec.coins)
+        items = flat([(ix, iy) for (ix, iy, _) in spec.items],
+                     [ord('B' if kind == "1up" else '?') for (_, _, kind) in spec.items])
+        enemies = flat([(e.x, e.y) for e in spec.enemies])
+        packed = spec._packed = (coins, items, enemies)
+    return packed
+
 def build_level_grid(spec: LevelSpec) -> Grid:
     grid = make_grid(spec.width, spec.height, ' ')
     x = 0
     for (kind, args) in spec.chunks:
-        if kind == "flat":
-            op, w = chunk_flat(*args)
-        elif kind == "pit":
-            op, w = chunk_pit(*args)
-        elif kind == "bridge":
-            op, w = chunk_bridge(*args)
-        elif kind == "pipe":
-            op, w = chunk_pipe(*args)
-        elif kind == "stairs_up":
-            op, w = chunk_stairs_up(*args)
-        elif kind == "stairs_down":
-            op, w = chunk_stairs_down(*args)
-        elif kind == "platforms":
-            op, w = chunk_platforms(*args)
-        elif kind == "cave":
-            op, w = chunk_cave_ceiling(*args)
-        elif kind == "airship":
-            op, w = chunk_airship(*args)
-        else:
+        op = _CHUNK_OPS.get(kind)
+        if op is None:
             raise ValueError(f"Unknown chunk kind: {kind}")
-        op(grid, x, spec)
-        x += w
+        x += op(grid, x, spec, *args)
 
     if x < spec.width:
-        flat_op, _ = chunk_flat(spec.width - x)
-        flat_op(grid, x, spec)
+        _stamp_flat(grid, x, spec, spec.width - x)
 
     if spec.waterline is not None:
-        for y in range(spec.waterline, spec.height):
-            for xx in range(spec.width):
-                if grid[y][xx] == ' ':
-                    grid[y][xx] = '~'
-
-    for (cx, cy) in spec.coins:
-        _stamp(grid, cx, cy, 'C')
-    for (ix, iy, kind) in spec.items:
-        _stamp(grid, ix, iy, '?' if kind != "1up" else 'B')
-    for e in spec.enemies:
-        _stamp(grid, e.x, e.y, 'E')
+        # Flood every empty cell at or below the waterline in one masked store
+        region = grid[spec.waterline:spec.height]
+        region[region == SPACE] = WATER
+
+    coin_idx, (item_idx, item_tiles), enemy_idx = _pack_spec(spec)
+    cells = grid.ravel()
+    cells[coin_idx] = ord('C')
+    cells[item_idx] = item_tiles
+    cells[enemy_idx] = ord('E')
 
     _stamp(grid, spec.player_start[0], spec.player_start[1], 'P')
     _stamp(grid, spec.goal_x, spec.ground_y - 5, 'G')
 
     return grid
 
+def apply_flip(grid: Grid, rules: Dict[str, str]) -> Grid:
+    """Return a copy of grid with every tile substituted per a LevelSpec's flip_rules."""
+    out = grid.copy()
+    # Masks are taken from the original grid, so swaps like '#' <-> ' ' work
+    for src, dst in rules.items():
+        out[grid == ord(src)] = ord(dst)
+    return out
+
 # ---------------------------
 # World 3 Levels (unchanged from original)
 # ---------------------------
@@ -224,17 +231,8 @@ def build_level_grid(spec: LevelSpec) -> Grid:
 def L(id, name, theme, chunks, **kw) -> LevelSpec:
     base = dict(
         id=id, name=name, theme=theme,
-        width=sum({
-            "flat": lambda w: w,
-            "pit": lambda w, *_: w,
-            "bridge": lambda w: w,
-            "pipe": lambda w, *_: w,
-            "stairs_up": lambda w, *_: w,
-            "stairs_down": lambda w, *_: w,
-            "platforms": lambda w, *_: w,
-            "cave": lambda w, *_: w,
-            "airship": lambda w: w
-        }[k](*a) if k != "pipe" else (a[0] + 2) for (k, a) in chunks) + 32,
+        # Same sizing as before: first chunk arg, +2 for pipes, plus a 32-tile tail
+        width=sum(a[0] + (2 if k == "pipe" else 0) for (k, a) in chunks) + 32,
         height=16, ground_y=13, goal_x=0, chunks=chunks, player_start=(2, 10),
         enemies=[], coins=[], items=[]
     )
@@ -349,6 +347,15 @@ WORLD3_LEVELS: List[LevelSpec] = [
       music="boss", par_time=999, time_limit=400, rng_seed=315)
 ]
 
+# LevelSpecs are static, so every grid is built once here and shared (read-only)
+def _frozen_grid(spec: LevelSpec) -> Grid:
+    _pack_spec(spec)
+    grid = build_level_grid(spec)
+    grid.flags.writeable = False
+    return grid
+
+_GRID_CACHE: Dict[str, Grid] = {spec.id: _frozen_grid(spec) for spec in WORLD3_LEVELS}
+
 # ---------------------------
 # Pygame 2D Visualization
 # ---------------------------
@@ -358,6 +365,11 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 480
 TILE_SIZE = 32
 
+# Rightmost camera position of each level, fixed with its grid
+_MAX_CAMERA: Dict[str, int] = {
+    level_id: grid.shape[1] * TILE_SIZE - SCREEN_WIDTH for level_id, grid in _GRID_CACHE.items()
+}
+
 # Colors
 COLORS = {
     ' ': (0, 0, 0),           # Background (black)
@@ -376,49 +388,75 @@ COLORS = {
     'K': (128, 0, 128),      # Kamek boss (purple)
 }
 
-def draw_level(screen, grid, camera_x):
+def _build_palette() -> np.ndarray:
+    """Tile byte -> RGB; characters missing from COLORS stay background black"""
+    palette = np.zeros((256, 3), dtype=np.uint8)
+    for ch, rgb in COLORS.items():
+        palette[ord(ch)] = rgb
+    return palette
+
+PALETTE = _build_palette()
+
+# Tiles that get extra detail drawn over their flat colour
+_DETAIL_TILES = np.array([ord(c) for c in "XB?C~"], dtype=np.uint8)
+
+# Fonts and fixed glyphs are built once, not per tile or per frame
+_FONT = pygame.font.SysFont(None, 24)
+_Q_SURF = _FONT.render("?", True, (0, 0, 0))
+_HUD_FONT = _FONT
+
+def prerender_level(grid: Grid) -> pygame.Surface:
+    """Draw the whole static level once into a full-size Surface."""
+    height, width = grid.shape
+    # Base layer: one pixel per tile straight from the palette, scaled up
+    base = pygame.surfarray.make_surface(PALETTE[grid].transpose(1, 0, 2))
+    surface = pygame.transform.scale(base, (width * TILE_SIZE, height * TILE_SIZE)).convert()
+
+    # Detailed tiles are stamped from pre-drawn sprites in one batched blits call
+    sprites = _detail_sprites()
+    ys, xs = np.nonzero(np.isin(grid, _DETAIL_TILES))
+    surface.blits([(sprites[chr(grid[y, x])], (x * TILE_SIZE, y * TILE_SIZE))
+                   for y, x in zip(ys.tolist(), xs.tolist())], doreturn=False)
+    return surface
+
+@lru_cache(maxsize=1)
+def _detail_sprites() -> Dict[str, pygame.Surface]:
+    """One TILE_SIZE sprite per detailed tile: its colour plus the detail on top."""
+    sprites = {}
+    for tile in map(chr, _DETAIL_TILES.tolist()):
+        sprite = pygame.Surface((TILE_SIZE, TILE_SIZE)).convert()
+        sprite.fill(COLORS[tile])
+        # Add some visual details for certain tiles
+        if tile == 'X':  # Ground texture
+            pygame.draw.rect(sprite, (100, 50, 0), (0, 0, TILE_SIZE, TILE_SIZE), 1)
+        elif tile == 'B':  # Brick pattern
+            pygame.draw.line(sprite, (150, 0, 0), (0, 0), (TILE_SIZE, TILE_SIZE), 2)
+            pygame.draw.line(sprite, (150, 0, 0), (TILE_SIZE, 0), (0, TILE_SIZE), 2)
+        elif tile == '?':  # Question mark
+            sprite.blit(_Q_SURF, (10, 5))
+        elif tile == 'C':  # Coin circle
+            pygame.draw.circle(sprite, (255, 255, 0),
+                            (TILE_SIZE//2, TILE_SIZE//2), TILE_SIZE//3)
+        elif tile == '~':  # Water waves
+            for i in range(0, TILE_SIZE, 8):
+                pygame.draw.arc(sprite, (0, 0, 200), [0, i//2, TILE_SIZE, 10], 0, 3.14, 1)
+        sprites[tile] = sprite
+    return sprites
+
+@lru_cache(maxsize=3)
+def level_surface(level_id: str) -> pygame.Surface:
+    # A full level surface is several MB, so only the current and recently
+    # visited levels are kept
+    return prerender_level(_GRID_CACHE[level_id])
+
+def draw_level(screen, surface, camera_x):
     screen.fill(COLORS[' '])
-    
-    for y, row in enumerate(grid):
-        for x, tile in enumerate(row):
-            screen_x = x * TILE_SIZE - camera_x
-            screen_y = y * TILE_SIZE
-            
-            # Only draw tiles that are visible on screen
-            if -TILE_SIZE <= screen_x < SCREEN_WIDTH:
-                if tile in COLORS:
-                    pygame.draw.rect(screen, COLORS[tile], 
-                                    (screen_x, screen_y, TILE_SIZE, TILE_SIZE))
-                    
-                    # Add some visual details for certain tiles
-                    if tile == 'X':  # Ground texture
-                        pygame.draw.rect(screen, (100, 50, 0), 
-                                        (screen_x, screen_y, TILE_SIZE, TILE_SIZE), 1)
-                    elif tile == 'B':  # Brick pattern
-                        pygame.draw.line(screen, (150, 0, 0), 
-                                        (screen_x, screen_y), 
-                                        (screen_x + TILE_SIZE, screen_y + TILE_SIZE), 2)
-                        pygame.draw.line(screen, (150, 0, 0), 
-                                        (screen_x + TILE_SIZE, screen_y), 
-                                        (screen_x, screen_y + TILE_SIZE), 2)
-                    elif tile == '?':  # Question mark
-                        font = pygame.font.SysFont(None, 24)
-                        text = font.render("?", True, (0, 0, 0))
-                        screen.blit(text, (screen_x + 10, screen_y + 5))
-                    elif tile == 'C':  # Coin circle
-                        pygame.draw.circle(screen, (255, 255, 0), 
-                                        (screen_x + TILE_SIZE//2, screen_y + TILE_SIZE//2), 
-                                        TILE_SIZE//3)
-                    elif tile == '~':  # Water waves
-                        for i in range(0, TILE_SIZE, 8):
-                            pygame.draw.arc(screen, (0, 0, 200), 
-                                        [screen_x, screen_y + i//2, TILE_SIZE, 10], 
-                                        0, 3.14, 1)
-    
+    # The level is static: copy the visible window out of the pre-rendered surface
+    screen.blit(surface, (0, 0), area=pygame.Rect(camera_x, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+
     # Draw level info
-    font = pygame.font.SysFont(None, 24)
     info_text = f"Level: {current_level+1}/15 - {WORLD3_LEVELS[current_level].name}"
-    text = font.render(info_text, True, (255, 255, 255))
+    text = _HUD_FONT.render(info_text, True, (255, 255, 255))
     screen.blit(text, (10, 10))
     
     pygame.display.flip()
@@ -431,9 +469,8 @@ def main():
     pygame.display.set_caption("World 3 Level Viewer")
     clock = pygame.time.Clock()
     
-    # Build the first level
-    grid = build_level_grid(WORLD3_LEVELS[current_level])
-    level_width = len(grid[0]) * TILE_SIZE
+    # Load the first level
+    max_camera = _MAX_CAMERA[WORLD3_LEVELS[current_level].id]
     
     camera_x = 0
     running = True
@@ -444,23 +481,21 @@ def main():
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RIGHT:
-                    camera_x = min(camera_x + 100, level_width - SCREEN_WIDTH)
+                    camera_x = min(camera_x + 100, max_camera)
                 elif event.key == pygame.K_LEFT:
                     camera_x = max(camera_x - 100, 0)
                 elif event.key == pygame.K_n:
                     # Next level
                     current_level = (current_level + 1) % len(WORLD3_LEVELS)
-                    grid = build_level_grid(WORLD3_LEVELS[current_level])
-                    level_width = len(grid[0]) * TILE_SIZE
+                    max_camera = _MAX_CAMERA[WORLD3_LEVELS[current_level].id]
                     camera_x = 0
                 elif event.key == pygame.K_p:
                     # Previous level
                     current_level = (current_level - 1) % len(WORLD3_LEVELS)
-                    grid = build_level_grid(WORLD3_LEVELS[current_level])
-                    level_width = len(grid[0]) * TILE_SIZE
+                    max_camera = _MAX_CAMERA[WORLD3_LEVELS[current_level].id]
                     camera_x = 0
         
-        draw_level(screen, grid, camera_x)
+        draw_level(screen, level_surface(WORLD3_LEVELS[current_level].id), camera_x)
         clock.tick(30)
     
     pygame.quit()
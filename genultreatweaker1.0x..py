@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
+import mmap
 import os
 import struct
 
@@ -106,29 +107,40 @@ class SM64AssetDumper:
                 messagebox.showerror("Error", "No write permission for selected directory.")
                 return
                 
-            with open(self.rom_path, "rb") as rom_file:
-                rom_data = rom_file.read()
-                
             # Dump entire ROM as ASM
             self.output_text.insert(tk.END, "Dumping entire ROM as ASM...\n")
+            # Log lines are collected and inserted into the Text widget in one go
+            log_buf = []
             try:
                 md = Cs(CS_ARCH_MIPS, CS_MODE_MIPS32 + CS_MODE_BIG_ENDIAN)
+                # Emit undecodable words as .byte and keep going instead of
+                # stopping at the first data word in a chunk
+                md.skipdata = True
                 output_file = os.path.join(output_dir, "rom.asm")
-                with open(output_file, "w") as asm_file:
+                # Map the ROM instead of reading it whole; only the current chunk is copied
+                with open(self.rom_path, "rb") as rom_file, \
+                        mmap.mmap(rom_file.fileno(), 0, access=mmap.ACCESS_READ) as rom_map, \
+                        open(output_file, "w", buffering=1 << 20) as asm_file:
                     # Process ROM in chunks to handle large files
                     chunk_size = 0x100000  # 1MB chunks
-                    for offset in range(0, len(rom_data), chunk_size):
-                        chunk = rom_data[offset:offset + chunk_size]
-                        instructions_found = False
-                        for i in md.disasm(chunk, offset):
-                            asm_file.write(f"0x{i.address:08X}:\t{i.mnemonic}\t{i.op_str}\n")
-                            instructions_found = True
-                        if not instructions_found:
-                            self.output_text.insert(tk.END, f"Warning: No valid instructions in chunk at offset 0x{offset:08X}. May contain data.\n")
-                self.output_text.insert(tk.END, "Saved rom.asm\n")
+                    for offset in range(0, len(rom_map), chunk_size):
+                        # A handful of 1MB chunks per ROM, so a per-chunk status is cheap
+                        self.status.config(text=f"Status: Dumping ASM... 0x{offset:08X} / 0x{len(rom_map):08X}")
+                        self.root.update_idletasks()
+                        chunk = rom_map[offset:offset + chunk_size]
+                        # disasm_lite yields plain tuples instead of CsInsn objects;
+                        # lines are collected and written once per chunk
+                        insns = list(md.disasm_lite(chunk, offset))
+                        asm_file.write("".join(f"0x{address:08X}:\t{mnemonic}\t{op_str}\n"
+                                               for (address, size, mnemonic, op_str) in insns))
+                        if all(mnemonic == ".byte" for (_, _, mnemonic, _) in insns):
+                            log_buf.append(f"Warning: No valid instructions in chunk at offset 0x{offset:08X}. May contain data.\n")
+                log_buf.append("Saved rom.asm\n")
             except Exception as e:
-                self.output_text.insert(tk.END, f"Error dumping ASM: {str(e)}\n")
+                log_buf.append(f"Error dumping ASM: {str(e)}\n")
                 raise
+            finally:
+                self.output_text.insert(tk.END, "".join(log_buf))
                 
             self.status.config(text="Status: ASM dump complete")
             messagebox.showinfo("Success", "Entire ROM dumped as ASM successfully")
@@ -156,25 +168,31 @@ class SM64AssetDumper:
                 messagebox.showerror("Error", "No write permission for selected directory.")
                 return
                 
-            with open(self.rom_path, "rb") as rom_file:
-                rom_data = rom_file.read()
-                
-            # Dump all asset sections
-            for name, (start, end, typ) in self.SECTIONS.items():
-                if typ != "bin":
-                    continue
-                if end > len(rom_data):
-                    self.output_text.insert(tk.END, f"Warning: Section {name} exceeds ROM size, skipping.\n")
-                    continue
-                self.output_text.insert(tk.END, f"Dumping {name}...\n")
-                data = rom_data[start:end]
-                try:
-                    output_file = os.path.join(output_dir, f"{name}.bin")
-                    with open(output_file, "wb") as asset_file:
-                        asset_file.write(data)
-                    self.output_text.insert(tk.END, f"Saved {name}.bin\n")
-                except Exception as e:
-                    self.output_text.insert(tk.END, f"Error dumping {name}: {str(e)}\n")
+            # Sections are streamed from the ROM file, never loaded whole.
+            # Log lines are collected and inserted into the Text widget in one go.
+            log_buf = []
+            try:
+                with open(self.rom_path, "rb") as rom_file:
+                    rom_size = os.fstat(rom_file.fileno()).st_size
+                    # Dump all asset sections
+                    for name, (start, end, typ) in self.SECTIONS.items():
+                        if typ != "bin":
+                            continue
+                        if end > rom_size:
+                            log_buf.append(f"Warning: Section {name} exceeds ROM size, skipping.\n")
+                            continue
+                        self.status.config(text=f"Status: Dumping {name}...")
+                        self.root.update_idletasks()
+                        log_buf.append(f"Dumping {name}...\n")
+                        try:
+                            output_file = os.path.join(output_dir, f"{name}.bin")
+                            with open(output_file, "wb") as asset_file:
+                                self.copy_range(rom_file, asset_file, start, end - start)
+                            log_buf.append(f"Saved {name}.bin\n")
+                        except Exception as e:
+                            log_buf.append(f"Error dumping {name}: {str(e)}\n")
+            finally:
+                self.output_text.insert(tk.END, "".join(log_buf))
                 
             self.status.config(text="Status: Asset dump complete")
             messagebox.showinfo("Success", "Asset sections dumped successfully")
@@ -184,6 +202,23 @@ class SM64AssetDumper:
             self.output_text.insert(tk.END, f"Error: {str(e)}\n")
             messagebox.showerror("Error", f"Failed to dump assets: {str(e)}")
 
+    def copy_range(self, src, dst, start, length):
+        """Copy length bytes at offset start from src to dst, in the kernel where possible."""
+        if hasattr(os, "sendfile"):
+            try:
+                while length > 0:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), start, length)
+                    if sent == 0:
+                        raise EOFError("ROM ended before the section did")
+                    start += sent
+                    length -= sent
+                return
+            except OSError:
+                # Not supported for this pair of files; fall back to a plain copy
+                pass
+        src.seek(start)
+        dst.write(src.read(length))
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = SM64AssetDumper(root)
@@ -1,6 +1,13 @@
 import pygame
 import asyncio
 import platform
+from collections import defaultdict
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Numba is optional (and absent in the browser); Mario keeps the Python path
+    njit = None
 
 # Initialize Pygame
 pygame.init()
@@ -9,6 +16,10 @@ pygame.init()
 WIDTH, HEIGHT = 600, 400
 SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Super Mario World - NES Style")
+# Keys are polled with get_pressed, so QUIT is the only event ever read;
+# everything else is dropped by SDL instead of piling up in the queue
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(pygame.QUIT)
 
 # Colors (NES palette approximation)
 WHITE = (255, 255, 255)
@@ -23,60 +34,130 @@ FPS = 60
 GRAVITY = 0.8
 JUMP_FORCE = -15
 MOVE_SPEED = 5
+# Bounds for Mario's Rect.clamp_ip: the screen's width, with a screen
+# height of slack above and below so he is only held in horizontally
+# (he still has to be able to fall off the bottom and respawn)
+PLAYFIELD = pygame.Rect(0, -HEIGHT, WIDTH, 3 * HEIGHT)
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def integrate(x, y, fy, vx, vy, width, height, boxes):
+        """Mario's physics tick, compiled: gravity, move, platform resolve, x clamp.
+        boxes is an (N, 4) int32 array of platform rects (x, y, w, h) in list order.
+        Returns (x, y, fy, vy, on_ground).
+        """
+        vy += GRAVITY
+        fy += vy
+        dy = round(fy)
+        fy -= dy
+        x += vx
+        y += dy
+
+        # Same as collidelistall on the moved rect, then re-check each hit
+        # against the rect as earlier hits have pushed it
+        on_ground = False
+        hx, hy = x, y
+        for i in range(boxes.shape[0]):
+            px, py, pw, ph = boxes[i, 0], boxes[i, 1], boxes[i, 2], boxes[i, 3]
+            if not (hx < px + pw and hy < py + ph and hx + width > px and hy + height > py):
+                continue
+            if not (x < px + pw and y < py + ph and x + width > px and y + height > py):
+                continue
+            if vy > 0 and y + height <= py + ph:
+                y = py - height
+                fy = 0.0
+                vy = 0.0
+                on_ground = True
+            elif vy < 0 and y >= py:
+                y = py + ph
+                fy = 0.0
+                vy = 0.0
+
+        x = max(0, min(x, WIDTH - width))
+        return x, y, fy, vy, on_ground
+else:
+    integrate = None
+
+def solid_sprite(color, size=(16, 16)):
+    """A display-format surface filled with one colour, for blitting placeholders."""
+    sprite = pygame.Surface(size).convert()
+    sprite.fill(color)
+    return sprite
 
 # Mario class
 class Mario:
+    sprite = solid_sprite(RED)
+
     def __init__(self):
         self.width, self.height = 16, 16  # NES-style sprite size
-        self.x, self.y = 50, HEIGHT - 40
         self.vx, self.vy = 0, 0
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        # The rect is the position; _fy keeps the sub-pixel part of y that
+        # gravity accumulates (x always moves in whole pixels)
+        self.rect = pygame.Rect(50, HEIGHT - 40, self.width, self.height)
+        self._fy = 0.0
         self.on_ground = False
 
-    def update(self, keys, platforms):
-        # Horizontal movement
-        self.vx = 0
-        if keys[pygame.K_LEFT]:
-            self.vx = -MOVE_SPEED
-        if keys[pygame.K_RIGHT]:
-            self.vx = MOVE_SPEED
+    # Key codes are bound as defaults so the per-frame lookups are locals
+    def update(self, keys, platform_hash, platform_boxes=None,
+               _left=pygame.K_LEFT, _right=pygame.K_RIGHT, _jump=pygame.K_SPACE):
+        # Horizontal movement (right wins when both are held)
+        self.vx = (keys[_right] or -keys[_left]) * MOVE_SPEED
 
         # Jumping
-        if keys[pygame.K_SPACE] and self.on_ground:
+        if keys[_jump] and self.on_ground:
             self.vy = JUMP_FORCE
             self.on_ground = False
 
+        if platform_boxes is not None:
+            # Compiled path: the rest of the tick runs in integrate()
+            rect = self.rect
+            rect.x, rect.y, self._fy, self.vy, self.on_ground = integrate(
+                rect.x, rect.y, self._fy, self.vx, float(self.vy),
+                self.width, self.height, platform_boxes)
+            if rect.y + self._fy > HEIGHT:
+                self.respawn()
+            return
+
         # Apply gravity
         self.vy += GRAVITY
-        self.x += self.vx
-        self.y += self.vy
-        self.rect.topleft = (self.x, self.y)
+        self._fy += self.vy
+        dy = round(self._fy)
+        self._fy -= dy
+        self.rect.move_ip(self.vx, dy)
 
-        # Platform collision
+        # Platform collision: scan only platforms in nearby cells, then resolve the hits
         self.on_ground = False
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                if self.vy > 0 and self.rect.bottom <= platform.rect.bottom:
-                    self.rect.bottom = platform.rect.top
-                    self.y = self.rect.y
-                    self.vy = 0
-                    self.on_ground = True
-                elif self.vy < 0 and self.rect.top >= platform.rect.top:
-                    self.rect.top = platform.rect.bottom
-                    self.y = self.rect.y
-                    self.vy = 0
+        mr = self.rect
+        nearby = platform_hash.near(mr)
+        for i in mr.collidelistall(nearby):
+            pr = nearby[i]
+            if not mr.colliderect(pr):
+                continue  # Already pushed clear by an earlier hit
+            pt, pb = pr.top, pr.bottom
+            if self.vy > 0 and mr.bottom <= pb:
+                mr.bottom = pt
+                self._fy = 0.0
+                self.vy = 0
+                self.on_ground = True
+            elif self.vy < 0 and mr.top >= pt:
+                mr.top = pb
+                self._fy = 0.0
+                self.vy = 0
 
         # Keep Mario on screen
-        self.x = max(0, min(self.x, WIDTH - self.width))
-        if self.y > HEIGHT:
-            self.y = HEIGHT - 40
-            self.vy = 0
-            self.on_ground = True
-        self.rect.topleft = (self.x, self.y)
+        mr.clamp_ip(PLAYFIELD)
+        if mr.y + self._fy > HEIGHT:
+            self.respawn()
+
+    def respawn(self):
+        self.rect.y = HEIGHT - 40
+        self._fy = 0.0
+        self.vy = 0
+        self.on_ground = True
 
     def draw(self, surface):
         # Draw Mario as a red rectangle (NES-style placeholder)
-        pygame.draw.rect(surface, RED, self.rect)
+        surface.blit(self.sprite, self.rect)
 
 # Platform class
 class Platform:
@@ -87,37 +168,66 @@ class Platform:
         # Draw platform as brown rectangle (NES-style ground)
         pygame.draw.rect(surface, BROWN, self.rect)
 
+# Uniform-grid spatial hash over static rects
+class SpatialHash:
+    def __init__(self, rects, cell_size=32):
+        self.rects = rects
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        for i, rect in enumerate(rects):
+            for cell in self._cells(rect):
+                self.cells[cell].append(i)
+
+    def _cells(self, rect):
+        size = self.cell_size
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield cx, cy
+
+    def near(self, rect):
+        """Rects sharing a cell with rect, in their original order."""
+        found = set()
+        for cell in self._cells(rect):
+            found.update(self.cells.get(cell, ()))
+        return [self.rects[i] for i in sorted(found)]
+
 # Goomba class
 class Goomba:
+    sprite = solid_sprite(BROWN)
+
     def __init__(self, x, y):
         self.width, self.height = 16, 16
-        self.x, self.y = x, y
         self.vx = -2  # Move left
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-
-    def update(self, platforms):
-        self.x += self.vx
-        self.rect.topleft = (self.x, self.y)
-
-        # Platform collision
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                if self.vx > 0:
-                    self.rect.right = platform.rect.left
-                elif self.vx < 0:
-                    self.rect.left = platform.rect.right
-                self.x = self.rect.x
-                self.vx = -self.vx
-
-        # Keep Goomba on screen
-        if self.x < 0 or self.x > WIDTH - self.width:
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+
+    def update(self, platform_hash):
+        self.rect.move_ip(self.vx, 0)
+
+        # Platform collision: scan only platforms in nearby cells, then resolve the hits
+        gr = self.rect
+        nearby = platform_hash.near(gr)
+        for i in gr.collidelistall(nearby):
+            pr = nearby[i]
+            if not gr.colliderect(pr):
+                continue  # Already pushed clear by an earlier hit
+            vx = self.vx
+            if vx > 0:
+                gr.right = pr.left
+            elif vx < 0:
+                gr.left = pr.right
+            self.vx = -vx
+
+        # Keep Goomba on screen: bounce off whichever edge it crossed
+        if gr.left < 0:
+            gr.left = 0
+            self.vx = -self.vx
+        elif gr.right > WIDTH:
+            gr.right = WIDTH
             self.vx = -self.vx
-            self.x = max(0, min(self.x, WIDTH - self.width))
-        self.rect.topleft = (self.x, self.y)
 
     def draw(self, surface):
         # Draw Goomba as a brown rectangle (NES-style placeholder)
-        pygame.draw.rect(surface, BROWN, self.rect)
+        surface.blit(self.sprite, self.rect)
 
 # Game setup
 mario = Mario()
@@ -125,45 +235,74 @@ platforms = [
     Platform(0, HEIGHT - 20, WIDTH, 20),  # Ground
     Platform(200, HEIGHT - 100, 100, 20),  # Floating platform
 ]
+# Platforms never move, so they are hashed into grid cells once
+platform_hash = SpatialHash([p.rect for p in platforms])
+# With Numba, Mario's physics scans them as a packed int32 array instead
+platform_boxes = None
+if integrate is not None:
+    platform_boxes = np.array([tuple(p.rect) for p in platforms], dtype=np.int32).reshape(-1, 4)
+
+# ...and they are drawn once onto the background that each frame starts from
+background = pygame.Surface((WIDTH, HEIGHT)).convert()
+background.fill(BLACK)
+for p in platforms:
+    p.draw(background)
 goombas = [Goomba(300, HEIGHT - 36)]
 
 async def main():
     def setup():
         pass  # Initialization done above
 
+    # Screen areas the sprites covered on the last frame; the first frame
+    # repaints the whole screen
+    drawn = [SCREEN.get_rect()]
+
     def update_loop():
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                return
+        if pygame.event.get(pygame.QUIT):
+            pygame.quit()
+            return
 
         keys = pygame.key.get_pressed()
-        mario.update(keys, platforms)
+        mario.update(keys, platform_hash, platform_boxes)
         for goomba in goombas:
-            goomba.update(platforms)
+            goomba.update(platform_hash)
 
         # Collision with Goombas
-        for goomba in goombas:
+        stomped = None
+        for i, goomba in enumerate(goombas):
             if mario.rect.colliderect(goomba.rect):
                 if mario.vy > 0 and mario.rect.bottom <= goomba.rect.bottom:
-                    goombas.remove(goomba)  # Mario jumps on Goomba
+                    stomped = i  # Mario jumps on Goomba
+                    break
                 else:
-                    mario.y = HEIGHT - 40  # Reset Mario (simulated death)
-                    mario.vy = 0
-                    mario.on_ground = True
-
-        # Draw everything
-        SCREEN.fill(BLACK)  # Clear screen
-        for platform in platforms:
-            platform.draw(SCREEN)
-        for goomba in goombas:
-            goomba.draw(SCREEN)
-        mario.draw(SCREEN)
-        pygame.display.flip()
+                    mario.respawn()  # Reset Mario (simulated death)
+        if stomped is not None:
+            # Goomba order doesn't matter, so swap-pop instead of list.remove
+            goombas[stomped] = goombas[-1]
+            goombas.pop()
+
+        # Draw everything. Only the sprites change, so the static level is
+        # restored just under where they were and where they are now, and
+        # only those areas are pushed to the display
+        sprites = ([(goomba.sprite, goomba.rect) for goomba in goombas]
+                   + [(mario.sprite, mario.rect)])  # Mario last so he stays on top
+        now = [rect.copy() for _, rect in sprites]
+        dirty = drawn + now
+        SCREEN.blits([(background, rect, rect) for rect in dirty], doreturn=False)
+        SCREEN.blits(sprites, doreturn=False)
+        pygame.display.update(dirty)
+        drawn[:] = now
 
+    clock = pygame.time.Clock()
+    on_web = platform.system() == "Emscripten"
     while True:
         update_loop()
-        await asyncio.sleep(1.0 / FPS)
+        if on_web:
+            # The browser drives the frame; hand control back to it
+            await asyncio.sleep(1.0 / FPS)
+        else:
+            # asyncio's timer granularity undershoots 60 FPS; tick paces in C
+            clock.tick(FPS)
 
 if platform.system() == "Emscripten":
     asyncio.ensure_future(main())
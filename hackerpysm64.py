@@ -2,6 +2,11 @@ from ursina import *
 from ursina.prefabs.first_person_controller import FirstPersonController
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Initialize Ursina
 app = Ursina()
 window.title = 'Super Mario 64 - Peach\'s Castle'
@@ -17,6 +22,9 @@ AmbientLight(color=color.rgba(100, 100, 120, 255))
 
 # Mario character class with full 3D movement
 class Mario(Entity):
+    # Jump height multiplier by jump_count: regular, double, triple (highest!)
+    _JUMP_MULTS = (1.0, 1.2, 1.5)
+    
     def __init__(self):
         super().__init__(
             model='cube',
@@ -34,7 +42,9 @@ class Mario(Entity):
             position=(0, 0.6, 0)
         )
         
-        self.cap = Entity(
+        # Cap and mustache only ever move with the head, so they are baked
+        # into the head's mesh (vertex colours) and drawn in one call
+        Entity(
             parent=self.head,
             model='sphere',
             color=color.red,
@@ -42,13 +52,15 @@ class Mario(Entity):
             position=(0, 0.2, 0)
         )
         
-        self.mustache = Entity(
+        Entity(
             parent=self.head,
             model='cube',
             color=color.black,
             scale=(0.6, 0.1, 0.2),
             position=(0, -0.1, 0.4)
         )
+        self.head.combine()
+        self.head.color = color.white  # Colours now live in the vertices
         
         # Movement properties
         self.velocity = Vec3(0, 0, 0)
@@ -82,61 +94,88 @@ class Mario(Entity):
         if held_keys['s']:
             move_z -= 1
             
-        # Calculate movement direction relative to camera
-        forward = Vec3(camera.forward.x, 0, camera.forward.z).normalized()
-        right = Vec3(camera.right.x, 0, camera.right.z).normalized()
+        # Calculate movement direction relative to camera, on the XZ plane.
+        # Done in plain floats: the camera basis is read once and no
+        # temporary Vec3s are built
+        cam_forward = camera.forward
+        cam_right = camera.right
+        fx, fz = cam_forward.x, cam_forward.z
+        rx, rz = cam_right.x, cam_right.z
+        length = math.hypot(fx, fz)
+        if length:
+            fx, fz = fx / length, fz / length
+        length = math.hypot(rx, rz)
+        if length:
+            rx, rz = rx / length, rz / length
         
-        movement = (forward * move_z + right * move_x)
+        move_dx = fx * move_z + rx * move_x
+        move_dz = fz * move_z + rz * move_x
+        moving = math.hypot(move_dx, move_dz) > 0
         
-        if movement.length() > 0:
-            movement = movement.normalized()
+        if moving:
+            length = math.hypot(move_dx, move_dz)
+            move_dx, move_dz = move_dx / length, move_dz / length
             
             # Face movement direction
             if not self.long_jumping:
-                look_at = self.position + movement
-                self.look_at(Vec3(look_at.x, self.y, look_at.z))
+                self.look_at(Vec3(self.x + move_dx, self.y, self.z + move_dz))
             
+        # Physics runs on locals: time.dt and the velocity/position
+        # components are read once here and written back once below
+        dt = time.dt
+        v = self.velocity
+        vx, vy, vz = v.x, v.y, v.z
+        speed = self.movement_speed
+        
         # Apply movement
         if self.grounded:
-            self.velocity.x = movement.x * self.movement_speed
-            self.velocity.z = movement.z * self.movement_speed
+            vx = move_dx * speed
+            vz = move_dz * speed
         else:
             # Air control
-            self.velocity.x += movement.x * self.movement_speed * self.air_control * time.dt
-            self.velocity.z += movement.z * self.movement_speed * self.air_control * time.dt
+            air_accel = speed * self.air_control * dt
+            vx += move_dx * air_accel
+            vz += move_dz * air_accel
             
             # Limit air speed
-            horizontal_speed = Vec2(self.velocity.x, self.velocity.z).length()
-            if horizontal_speed > self.movement_speed * 1.5:
-                self.velocity.x = (self.velocity.x / horizontal_speed) * self.movement_speed * 1.5
-                self.velocity.z = (self.velocity.z / horizontal_speed) * self.movement_speed * 1.5
+            horizontal_speed = math.hypot(vx, vz)
+            max_air_speed = speed * 1.5
+            if horizontal_speed > max_air_speed:
+                vx = vx / horizontal_speed * max_air_speed
+                vz = vz / horizontal_speed * max_air_speed
         
         # Long jump
         if self.long_jumping:
-            self.long_jump_timer -= time.dt
+            self.long_jump_timer -= dt
             if self.long_jump_timer <= 0:
                 self.long_jumping = False
                 
         # Apply gravity
-        self.velocity.y -= self.gravity * time.dt
+        vy -= self.gravity * dt
         
         # Apply velocity
-        self.position += self.velocity * time.dt
+        x, y, z = self.getPos()
+        x += vx * dt
+        y += vy * dt
+        z += vz * dt
         
         # Ground detection
-        if self.y <= 1:
-            self.y = 1
-            self.velocity.y = 0
+        if y <= 1:
+            y = 1
+            vy = 0
             if not self.grounded:
                 self.grounded = True
                 self.jump_count = 0
                 self.long_jumping = False
         else:
             self.grounded = False
+        
+        self.setPos(x, y, z)
+        v.x, v.y, v.z = vx, vy, vz
             
         # Walking animation
-        if self.grounded and movement.length() > 0:
-            self.bob_timer += time.dt * 10
+        if self.grounded and moving:
+            self.bob_timer += dt * 10
             self.head.y = 0.6 + math.sin(self.bob_timer) * 0.05
         else:
             self.bob_timer = 0
@@ -144,22 +183,14 @@ class Mario(Entity):
             
         # Rotation animation when jumping
         if not self.grounded and not self.long_jumping:
-            self.rotation_x += 360 * time.dt
+            self.rotation_x += 360 * dt
         else:
-            self.rotation_x = lerp(self.rotation_x, 0, time.dt * 10)
+            self.rotation_x = lerp(self.rotation_x, 0, dt * 10)
             
     def jump(self):
+        # Landing resets jump_count to 0, so the index is always in range
         if self.grounded or self.jump_count < self.max_jumps:
-            if self.jump_count == 0:
-                # Regular jump
-                self.velocity.y = self.jump_height
-            elif self.jump_count == 1:
-                # Double jump
-                self.velocity.y = self.jump_height * 1.2
-            elif self.jump_count == 2:
-                # Triple jump - highest!
-                self.velocity.y = self.jump_height * 1.5
-                
+            self.velocity.y = self.jump_height * self._JUMP_MULTS[self.jump_count]
             self.jump_count += 1
             self.grounded = False
             
@@ -185,105 +216,55 @@ ground = Entity(
     texture_scale=(50, 50)
 )
 
-# Peach's Castle main structure
-castle_base = Entity(
-    model='cube',
-    color=color.rgb(255, 218, 185),
-    position=(0, 7, 20),
-    scale=(30, 14, 20)
-)
-
-# Castle towers
-left_tower = Entity(
-    model='cylinder',
-    color=color.rgb(255, 200, 160),
-    position=(-12, 10, 20),
-    scale=(5, 10, 5)
-)
-
-right_tower = Entity(
-    model='cylinder',
-    color=color.rgb(255, 200, 160),
-    position=(12, 10, 20),
-    scale=(5, 10, 5)
-)
-
-center_tower = Entity(
-    model='cylinder',
-    color=color.rgb(255, 200, 160),
-    position=(0, 15, 20),
-    scale=(6, 12, 6)
-)
-
-# Tower roofs (cone shapes)
-left_roof = Entity(
-    model='cone',
-    color=color.red,
-    position=(-12, 15, 20),
-    scale=(7, 5, 7)
-)
-
-right_roof = Entity(
-    model='cone',
-    color=color.red,
-    position=(12, 15, 20),
-    scale=(7, 5, 7)
-)
-
-center_roof = Entity(
-    model='cone',
-    color=color.red,
-    position=(0, 21, 20),
-    scale=(8, 6, 8)
-)
-
-# Castle entrance
-entrance = Entity(
-    model='cube',
-    color=color.rgb(139, 69, 19),
-    position=(0, 3, 9),
-    scale=(8, 6, 1)
+# Peach's Castle: static pieces as (model, position, scale, rgb)
+_STATIC_GEOM = (
+    # Main structure
+    ('cube', (0, 7, 20), (30, 14, 20), (255, 218, 185)),
+    # Towers
+    ('cylinder', (-12, 10, 20), (5, 10, 5), (255, 200, 160)),
+    ('cylinder', (12, 10, 20), (5, 10, 5), (255, 200, 160)),
+    ('cylinder', (0, 15, 20), (6, 12, 6), (255, 200, 160)),
+    # Tower roofs (cone shapes)
+    ('cone', (-12, 15, 20), (7, 5, 7), (255, 0, 0)),
+    ('cone', (12, 15, 20), (7, 5, 7), (255, 0, 0)),
+    ('cone', (0, 21, 20), (8, 6, 8), (255, 0, 0)),
+    # Castle entrance
+    ('cube', (0, 3, 9), (8, 6, 1), (139, 69, 19)),
+    # Bridge to castle
+    ('cube', (0, 0.5, 0), (6, 0.5, 20), (160, 82, 45)),
+    # Moat around castle
+    ('cube', (-15, -0.5, 10), (18, 1, 40), (64, 164, 223)),
+    ('cube', (15, -0.5, 10), (18, 1, 40), (64, 164, 223)),
 )
 
-# Bridge to castle
-bridge = Entity(
-    model='cube',
-    color=color.rgb(160, 82, 45),
-    position=(0, 0.5, 0),
-    scale=(6, 0.5, 20)
-)
-
-# Moat around castle
-moat_left = Entity(
-    model='cube',
-    color=color.rgb(64, 164, 223),
-    position=(-15, -0.5, 10),
-    scale=(18, 1, 40)
-)
-
-moat_right = Entity(
-    model='cube',
-    color=color.rgb(64, 164, 223),
-    position=(15, -0.5, 10),
-    scale=(18, 1, 40)
-)
+castle = Entity()
+for model, position, scale, rgb in _STATIC_GEOM:
+    Entity(parent=castle, model=model, position=position, scale=scale, color=color.rgb(*rgb))
+# None of it ever moves, so it is merged into one mesh and drawn in one call
+castle.combine()
 
 # Trees around courtyard
 class Tree(Entity):
     def __init__(self, position):
-        super().__init__(
+        super().__init__(position=position)
+        
+        # Trunk and leaves are laid out in tree space, then merged into
+        # this entity's single mesh so each tree is one draw call
+        Entity(
+            parent=self,
             model='cylinder',
             color=color.rgb(101, 67, 33),
-            position=position,
             scale=(1, 4, 1)
         )
         
-        self.leaves = Entity(
+        Entity(
+            parent=self,
             model='sphere',
             color=color.rgb(34, 139, 34),
-            position=position + Vec3(0, 4, 0),
+            position=(0, 4, 0),
             scale=5
         )
+        self.combine()
 
 # Place trees
 trees = [
@@ -309,11 +290,6 @@ class Coin(Entity):
         
     def update(self):
         self.rotation_z += self.rotation_speed * time.dt
-        
-        # Check collection
-        if distance(self.position, mario.position) < 1.5:
-            game.collect_coin()
-            destroy(self)
 
 # Place coins
 coins = [
@@ -325,11 +301,41 @@ coins = [
     Coin(Vec3(-10, 2, 10)),
 ]
 
+# Coin positions as one (N, 3) array, parallel to `coins`, so pickup is a
+# single squared-distance test against Mario per frame
+COIN_PICKUP_RADIUS_SQ = 1.5 ** 2
+coin_positions = [tuple(c.position) for c in coins]
+if np is not None:
+    coin_positions = np.array(coin_positions, dtype=np.float32).reshape(-1, 3)
+
+def collect_coins():
+    global coin_positions
+    if not coins:
+        return
+    mx, my, mz = mario.x, mario.y, mario.z
+    if np is not None:
+        d = coin_positions - np.array((mx, my, mz), dtype=np.float32)
+        hits = np.flatnonzero(np.einsum('ij,ij->i', d, d) < COIN_PICKUP_RADIUS_SQ).tolist()
+    else:
+        hits = [i for i, (x, y, z) in enumerate(coin_positions)
+                if (x - mx) ** 2 + (y - my) ** 2 + (z - mz) ** 2 < COIN_PICKUP_RADIUS_SQ]
+    if not hits:
+        return
+    for i in reversed(hits):
+        game.collect_coin()
+        destroy(coins.pop(i))
+    if np is not None:
+        coin_positions = np.delete(coin_positions, hits, axis=0)
+    else:
+        for i in reversed(hits):
+            del coin_positions[i]
+
 # Game manager
 class GameManager:
     def __init__(self):
         self.coins = 0
         self.stars = 0
+        self.hud_dirty = False
         
         # UI
         self.coin_text = Text(
@@ -363,13 +369,21 @@ class GameManager:
         
     def collect_coin(self):
         self.coins += 1
-        self.coin_text.text = f'Coins: {self.coins}'
         
         if self.coins >= 100:
             self.coins = 0
             self.stars += 1
-            self.star_text.text = f'Stars: {self.stars}/120'
-            self.coin_text.text = f'Coins: {self.coins}'
+        
+        # Text rebuilds its glyph mesh on every assignment, so the HUD is
+        # only redrawn once per frame in refresh_hud()
+        self.hud_dirty = True
+        
+    def refresh_hud(self):
+        if not self.hud_dirty:
+            return
+        self.coin_text.text = f'Coins: {self.coins}'
+        self.star_text.text = f'Stars: {self.stars}/120'
+        self.hud_dirty = False
 
 # Initialize game
 game = GameManager()
@@ -388,39 +402,42 @@ class CameraController:
         self.distance = 15
         self.height = 8
         self.smoothing = 5
-        self.rotation = 0
+        self.rotation_rad = 0  # Yaw kept in radians; converted once per mouse move
+        self._look_target = Vec3(0, 0, 0)  # Reused every frame for look_at
         
     def update(self):
         # Mouse camera control
         if mouse.right:
-            self.rotation -= mouse.velocity[0] * 100
+            self.rotation_rad -= math.radians(mouse.velocity[0] * 100)
             
         # Calculate target position
-        angle = math.radians(self.rotation)
-        target_x = mario.x + math.sin(angle) * self.distance
-        target_z = mario.z - math.cos(angle) * self.distance
-        target_y = mario.y + self.height
+        mx, my, mz = mario.getPos()
+        target_x = mx + math.sin(self.rotation_rad) * self.distance
+        target_z = mz - math.cos(self.rotation_rad) * self.distance
+        target_y = my + self.height
         
-        # Smooth camera movement
-        camera.position = lerp(
-            camera.position,
-            Vec3(target_x, target_y, target_z),
-            time.dt * self.smoothing
-        )
+        # Smooth camera movement, one scalar lerp per axis
+        t = time.dt * self.smoothing
+        cx, cy, cz = camera.getPos()
+        camera.setPos(cx + (target_x - cx) * t,
+                      cy + (target_y - cy) * t,
+                      cz + (target_z - cz) * t)
         
         # Look at Mario
-        camera.look_at(mario.position + Vec3(0, 2, 0))
+        look = self._look_target
+        look.x, look.y, look.z = mx, my + 2, mz
+        camera.look_at(look)
 
 cam_controller = CameraController()
 
 def input(key):
     if key == 'space':
-        mario.jump()
-    elif key == 'space' and held_keys['shift']:
-        mario.long_jump()
+        (mario.long_jump if held_keys['shift'] else mario.jump)()
 
 def update():
     mario.update()
     cam_controller.update()
+    collect_coins()
+    game.refresh_hud()
 
 app.run()
@@ -9,6 +9,34 @@ import threading
 from pathlib import Path
 import base64
 import mimetypes
+import functools
+import bisect
+from collections import deque
+
+# Bytes that turn up in text files: everything from space upwards except
+# DEL, plus bell, backspace, tab, newline, form feed, carriage return and escape
+_TEXTCHARS = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+
+def is_binary(data):
+    """Whether data holds any byte that never appears in text"""
+    # translate deletes every text byte in a single C-level pass; whatever
+    # is left over is binary
+    return bool(data.translate(None, _TEXTCHARS))
+
+def as_text(content):
+    """File content as a str for display or editing, or None if it is binary.
+    Files are stored as raw bytes and only decoded here, when opened.
+    """
+    if isinstance(content, (bytes, bytearray)):
+        if is_binary(content):
+            return None
+        # Decode strictly: anything that is not valid UTF-8 would be lost
+        # when the editor re-encodes the buffer on save
+        try:
+            return content.decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+    return content
 
 class VirtualFileSystem:
     """Virtual file system for the OS"""
@@ -53,39 +81,122 @@ class VirtualFileSystem:
             }
         }
         
+        # Every file and directory by absolute path, so navigate is a single
+        # dict lookup instead of a walk down from the root
+        self.index = {}
+        self._index_tree('/', self.root)
+        
+        # Each directory keeps the names of its subdirectories and files in
+        # sorted order, updated by bisection as children come and go, so
+        # listings never need a full sort
+        for node in self.index.values():
+            if node['type'] == 'directory':
+                node['_dirs_sorted'] = sorted(name for name, child in node['children'].items()
+                                              if child['type'] == 'directory')
+                node['_files_sorted'] = sorted(name for name, child in node['children'].items()
+                                               if child['type'] == 'file')
+        
+        # Bumped on every create, delete and rename, so callers can key
+        # their own caches of path lookups on it
+        self.version = 0
+        
+        # Creation time stamps at one second resolution, formatted once per
+        # second rather than once per file (bulk uploads create many at once)
+        self._last_ts_sec = 0
+        self._last_ts_str = ''
+        
         # Add some default files
         self.create_file('/home/user/Documents', 'readme.txt', 
                         'Welcome to GNU/Koopa OS!\n\nThis is a fully functional desktop environment.')
         self.create_file('/home/user/Documents', 'notes.md', 
                         '# My Notes\n\n- Try the Switch 2 gaming mode\n- Upload some ROM files\n- Explore the file system')
 
+    def _path_key(self, path, name=None):
+        """Index key for path (or for name inside it): absolute, no trailing slash"""
+        key = '/' + path.strip('/')
+        if name is not None:
+            key = f"{key.rstrip('/')}/{name}"
+        return key
+
+    def _index_tree(self, key, node):
+        """Add node and everything below it to the path index"""
+        self.index[key] = node
+        prefix = key.rstrip('/')
+        for name, child in node.get('children', {}).items():
+            self._index_tree(f"{prefix}/{name}", child)
+
+    def _unindex_tree(self, key, node):
+        """Drop node and everything below it from the path index"""
+        self.index.pop(key, None)
+        for name, child in node.get('children', {}).items():
+            self._unindex_tree(f"{key}/{name}", child)
+
+    @staticmethod
+    def _sorted_names(dir_node, node):
+        """The sorted name list in dir_node that node belongs in"""
+        return dir_node['_dirs_sorted' if node['type'] == 'directory' else '_files_sorted']
+
+    def _link(self, dir_node, name, node):
+        """Add node to dir_node as name, replacing any existing child"""
+        children = dir_node['children']
+        if name in children:
+            self._unlink(dir_node, name)
+        children[name] = node
+        bisect.insort(self._sorted_names(dir_node, node), name)
+
+    def _unlink(self, dir_node, name):
+        """Remove and return the child called name from dir_node"""
+        node = dir_node['children'].pop(name)
+        names = self._sorted_names(dir_node, node)
+        del names[bisect.bisect_left(names, name)]
+        return node
+
+    @staticmethod
+    def join(base, rel):
+        """Absolute path of rel taken from base, normalised in one pass:
+        empty and '.' parts are dropped and '..' steps up (never past the root)"""
+        segments = rel.split('/')
+        if not rel.startswith('/'):
+            segments = base.split('/') + segments
+        parts = []
+        for part in segments:
+            if part == '..':
+                if parts:
+                    parts.pop()
+            elif part and part != '.':
+                parts.append(part)
+        return '/' + '/'.join(parts)
+
     def navigate(self, path):
         """Navigate to a path and return the node"""
-        if path == '/':
-            return self.root
-        
-        parts = path.strip('/').split('/')
-        current = self.root
-        
-        for part in parts:
-            if current.get('children') and part in current['children']:
-                current = current['children'][part]
-            else:
-                return None
-        return current
+        return self.index.get(self._path_key(path))
 
     def create_file(self, path, name, content='', file_type='text'):
         """Create a new file"""
         dir_node = self.navigate(path)
         if dir_node and dir_node['type'] == 'directory':
-            dir_node['children'][name] = {
+            if isinstance(content, str):
+                # Text is kept encoded, like uploads; editors decode it on open
+                content = bytearray(content.encode('utf-8'))
+            now = int(time.time())
+            if now != self._last_ts_sec:
+                self._last_ts_str = datetime.fromtimestamp(now).isoformat()
+                self._last_ts_sec = now
+            key = self._path_key(path, name)
+            children = dir_node['children']
+            if name in children:
+                self._unindex_tree(key, children[name])
+            node = {
                 'type': 'file',
                 'name': name,
                 'content': content,
                 'file_type': file_type,
-                'size': len(content) if isinstance(content, (str, bytes)) else 0,
-                'created': datetime.now().isoformat()
+                'size': len(content) if isinstance(content, (bytes, bytearray)) else 0,
+                'created': self._last_ts_str
             }
+            self._link(dir_node, name, node)
+            self.index[key] = node
+            self.version += 1
             return True
         return False
 
@@ -93,45 +204,71 @@ class VirtualFileSystem:
         """Create a new directory"""
         dir_node = self.navigate(path)
         if dir_node and dir_node['type'] == 'directory':
-            dir_node['children'][name] = {
+            key = self._path_key(path, name)
+            children = dir_node['children']
+            if name in children:
+                self._unindex_tree(key, children[name])
+            node = {
                 'type': 'directory',
                 'name': name,
-                'children': {}
+                'children': {},
+                '_dirs_sorted': [],
+                '_files_sorted': []
             }
+            self._link(dir_node, name, node)
+            self.index[key] = node
+            self.version += 1
             return True
         return False
 
     def delete_item(self, path, name):
         """Delete a file or directory"""
         dir_node = self.navigate(path)
-        if dir_node and dir_node.get('children') and name in dir_node['children']:
-            del dir_node['children'][name]
+        children = dir_node.get('children') if dir_node else None
+        if children and name in children:
+            self._unindex_tree(self._path_key(path, name), children[name])
+            self._unlink(dir_node, name)
+            self.version += 1
             return True
         return False
 
     def read_file(self, path, name):
         """Read file content"""
-        dir_node = self.navigate(path)
-        if dir_node and dir_node.get('children') and name in dir_node['children']:
-            file_node = dir_node['children'][name]
-            if file_node['type'] == 'file':
-                return file_node.get('content', '')
+        # The index is keyed by whole paths, so the file is one lookup away
+        # without going through its directory
+        file_node = self.index.get(self._path_key(path, name))
+        if file_node and file_node['type'] == 'file':
+            return file_node.get('content', '')
         return None
 
     def list_directory(self, path):
-        """List directory contents"""
+        """List directory contents: directories, then files, each sorted by name"""
+        dirs, files = self.sorted_listing(path)
+        return dirs + files
+
+    def sorted_listing(self, path):
+        """Directory contents as (dirs, files), each sorted by name"""
         dir_node = self.navigate(path)
-        if dir_node and dir_node['type'] == 'directory':
-            return list(dir_node.get('children', {}).values())
-        return []
+        if not dir_node or dir_node['type'] != 'directory':
+            return [], []
+        children = dir_node['children']
+        return ([children[name] for name in dir_node['_dirs_sorted']],
+                [children[name] for name in dir_node['_files_sorted']])
 
     def rename_item(self, path, old_name, new_name):
         """Rename a file or directory"""
         dir_node = self.navigate(path)
-        if dir_node and dir_node.get('children') and old_name in dir_node['children']:
-            dir_node['children'][new_name] = dir_node['children'][old_name]
-            dir_node['children'][new_name]['name'] = new_name
-            del dir_node['children'][old_name]
+        children = dir_node.get('children') if dir_node else None
+        if children and old_name in children:
+            # The moved subtree (and anything it replaces) changes path
+            self._unindex_tree(self._path_key(path, old_name), children[old_name])
+            if new_name in children:
+                self._unindex_tree(self._path_key(path, new_name), children[new_name])
+            node = self._unlink(dir_node, old_name)
+            node['name'] = new_name
+            self._link(dir_node, new_name, node)
+            self._index_tree(self._path_key(path, new_name), node)
+            self.version += 1
             return True
         return False
 
@@ -161,22 +298,56 @@ class Window:
         title_bar.pack(fill=tk.X)
         title_bar.pack_propagate(False)
         
-        Label(title_bar, text=title, bg='#006633', fg='white',
-              font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        self.title_label = Label(title_bar, text=title, bg='#006633', fg='white',
+                                 font=('Arial', 10, 'bold'))
+        self.title_label.pack(side=tk.LEFT, padx=5)
         
         Button(title_bar, text="X", bg='#c0c0c0', fg='black',
                font=('Arial', 8, 'bold'), command=self.window.destroy,
                width=3).pack(side=tk.RIGHT, padx=2, pady=2)
 
+    def retitle(self, title):
+        """Change the title of an existing window and bring it to the front"""
+        self.window.title(title)
+        self.title_label.config(text=title)
+        self.window.deiconify()
+        self.window.lift()
+
+    def is_open(self):
+        """Whether the window is still on screen (it has not been closed)"""
+        return bool(self.window.winfo_exists())
+
 class Terminal(Window):
     """Terminal application"""
     def __init__(self, parent, fs):
         super().__init__(parent, "🐢 Koopa Shell", 600, 400)
         self.fs = fs
         self.current_dir = '/home/user'
-        self.history = []
+        self.history = deque(maxlen=500)
         self.history_index = 0
         
+        # cd targets resolved per (cwd, target, fs.version); a change to the
+        # file system bumps the version, so stale answers are never hit
+        self._resolve = functools.lru_cache(maxsize=128)(self._resolve_path)
+        
+        # Command name -> handler taking the argument list, built once
+        self._cmds = {
+            'ls': self._cmd_ls,
+            'pwd': self._cmd_pwd,
+            'cd': self._cmd_cd,
+            'mkdir': self._cmd_mkdir,
+            'touch': self._cmd_touch,
+            'rm': self._cmd_rm,
+            'cat': self._cmd_cat,
+            'echo': self._cmd_echo,
+            'clear': self._cmd_clear,
+            'help': self._cmd_help,
+            'uname': self._cmd_uname,
+            'date': self._cmd_date,
+            'switch2': self._cmd_switch2,
+            'exit': self._cmd_exit,
+        }
+        
         # Terminal display
         self.terminal = Text(self.content_frame, bg='black', fg='#00ff00',
                            font=('Courier', 10), insertbackground='#00ff00')
@@ -225,74 +396,95 @@ class Terminal(Window):
         args = parts[1:] if len(parts) > 1 else []
         
         # Command processing
-        if cmd == 'ls':
-            items = self.fs.list_directory(self.current_dir)
-            for item in items:
-                icon = '📁' if item['type'] == 'directory' else '📄'
-                self.terminal.insert('end', f"{icon} {item['name']}\n")
-                
-        elif cmd == 'pwd':
-            self.terminal.insert('end', f"{self.current_dir}\n")
-            
-        elif cmd == 'cd':
-            if args:
-                new_path = args[0]
-                if new_path == '..':
-                    parts = self.current_dir.split('/')
-                    if len(parts) > 2:
-                        self.current_dir = '/'.join(parts[:-1])
-                    elif len(parts) == 2 and parts[0] == '':
-                        self.current_dir = '/'
-                elif new_path.startswith('/'):
-                    if self.fs.navigate(new_path):
-                        self.current_dir = new_path
-                    else:
-                        self.terminal.insert('end', f"cd: {new_path}: No such directory\n")
-                else:
-                    test_path = f"{self.current_dir}/{new_path}".replace('//', '/')
-                    if self.fs.navigate(test_path):
-                        self.current_dir = test_path
-                    else:
-                        self.terminal.insert('end', f"cd: {new_path}: No such directory\n")
-                        
-        elif cmd == 'mkdir':
-            if args:
-                if self.fs.create_directory(self.current_dir, args[0]):
-                    self.terminal.insert('end', f"Directory '{args[0]}' created\n")
-                else:
-                    self.terminal.insert('end', f"mkdir: cannot create directory '{args[0]}'\n")
-                    
-        elif cmd == 'touch':
-            if args:
-                if self.fs.create_file(self.current_dir, args[0], ''):
-                    self.terminal.insert('end', f"File '{args[0]}' created\n")
-                    
-        elif cmd == 'rm':
-            if args:
-                if self.fs.delete_item(self.current_dir, args[0]):
-                    self.terminal.insert('end', f"Removed '{args[0]}'\n")
-                else:
-                    self.terminal.insert('end', f"rm: cannot remove '{args[0]}': No such file\n")
-                    
-        elif cmd == 'cat':
-            if args:
-                content = self.fs.read_file(self.current_dir, args[0])
-                if content is not None:
-                    if isinstance(content, bytes):
-                        self.terminal.insert('end', "[Binary file]\n")
-                    else:
-                        self.terminal.insert('end', f"{content}\n")
+        handler = self._cmds.get(cmd)
+        if handler is None:
+            self.terminal.insert('end', f"ksh: {cmd}: command not found\n")
+        elif handler(args):
+            return 'break'  # Terminal was closed, no prompt to show
+        
+        self.show_prompt()
+        return 'break'
+
+    def _batch_insert(self, text):
+        """Write a multi-line block of output in one insert and jump the view
+        straight to the bottom, so Tk lays the block out once rather than
+        scrolling through it line by line"""
+        self.terminal.insert('end', text)
+        self.terminal.yview_moveto(1.0)
+
+    def _cmd_ls(self, args):
+        """List directory contents"""
+        items = self.fs.list_directory(self.current_dir)
+        if items:
+            self._batch_insert(''.join(
+                f"{'📁' if item['type'] == 'directory' else '📄'} {item['name']}\n"
+                for item in items))
+
+    def _cmd_pwd(self, args):
+        """Print working directory"""
+        self.terminal.insert('end', f"{self.current_dir}\n")
+
+    def _cmd_cd(self, args):
+        """Change directory"""
+        if args:
+            new_dir = self._resolve(self.current_dir, args[0], self.fs.version)
+            if new_dir is None:
+                self.terminal.insert('end', f"cd: {args[0]}: No such directory\n")
+            else:
+                self.current_dir = new_dir
+
+    def _resolve_path(self, cwd, target, fs_version):
+        """Working directory after `cd target` from cwd, or None if it does
+        not exist. fs_version is unused here; it only keys the cache."""
+        path = self.fs.join(cwd, target)
+        return path if self.fs.navigate(path) else None
+
+    def _cmd_mkdir(self, args):
+        """Create directory"""
+        if args:
+            if self.fs.create_directory(self.current_dir, args[0]):
+                self.terminal.insert('end', f"Directory '{args[0]}' created\n")
+            else:
+                self.terminal.insert('end', f"mkdir: cannot create directory '{args[0]}'\n")
+
+    def _cmd_touch(self, args):
+        """Create empty file"""
+        if args:
+            if self.fs.create_file(self.current_dir, args[0], ''):
+                self.terminal.insert('end', f"File '{args[0]}' created\n")
+
+    def _cmd_rm(self, args):
+        """Remove file or directory"""
+        if args:
+            if self.fs.delete_item(self.current_dir, args[0]):
+                self.terminal.insert('end', f"Removed '{args[0]}'\n")
+            else:
+                self.terminal.insert('end', f"rm: cannot remove '{args[0]}': No such file\n")
+
+    def _cmd_cat(self, args):
+        """Display file contents"""
+        if args:
+            content = self.fs.read_file(self.current_dir, args[0])
+            if content is not None:
+                text = as_text(content)
+                if text is None:
+                    self.terminal.insert('end', "[Binary file]\n")
                 else:
-                    self.terminal.insert('end', f"cat: {args[0]}: No such file\n")
-                    
-        elif cmd == 'echo':
-            self.terminal.insert('end', ' '.join(args) + '\n')
-            
-        elif cmd == 'clear':
-            self.terminal.delete('1.0', 'end')
-            
-        elif cmd == 'help':
-            help_text = """Available commands:
+                    self._batch_insert(f"{text}\n")
+            else:
+                self.terminal.insert('end', f"cat: {args[0]}: No such file\n")
+
+    def _cmd_echo(self, args):
+        """Display text"""
+        self.terminal.insert('end', ' '.join(args) + '\n')
+
+    def _cmd_clear(self, args):
+        """Clear terminal"""
+        self.terminal.delete('1.0', 'end')
+
+    def _cmd_help(self, args):
+        """Show this help"""
+        help_text = """Available commands:
 ls       - List directory contents
 pwd      - Print working directory
 cd       - Change directory
@@ -308,51 +500,67 @@ switch2  - Launch Switch 2 Gaming Mode
 help     - Show this help
 exit     - Close terminal
 """
-            self.terminal.insert('end', help_text)
-            
-        elif cmd == 'uname':
-            self.terminal.insert('end', "GNU/Koopa 1.0.x koopa-kernel-5.19.0 x86_64\n")
-            
-        elif cmd == 'date':
-            self.terminal.insert('end', f"{datetime.now()}\n")
-            
-        elif cmd == 'switch2':
-            self.terminal.insert('end', "Launching Switch 2 Gaming Mode...\n")
-            Switch2Mode(self.parent, self.fs)
-            
-        elif cmd == 'exit':
-            self.window.destroy()
-            return 'break'
-            
-        else:
-            self.terminal.insert('end', f"ksh: {cmd}: command not found\n")
-        
-        self.show_prompt()
-        return 'break'
+        self._batch_insert(help_text)
+
+    def _cmd_uname(self, args):
+        """System information"""
+        self.terminal.insert('end', "GNU/Koopa 1.0.x koopa-kernel-5.19.0 x86_64\n")
+
+    def _cmd_date(self, args):
+        """Show date and time"""
+        self.terminal.insert('end', f"{datetime.now()}\n")
+
+    def _cmd_switch2(self, args):
+        """Launch Switch 2 Gaming Mode"""
+        self.terminal.insert('end', "Launching Switch 2 Gaming Mode...\n")
+        Switch2Mode(self.parent, self.fs)
+
+    def _cmd_exit(self, args):
+        """Close terminal; returns True so no new prompt is shown"""
+        self.window.destroy()
+        return True
 
     def history_up(self, event):
         """Navigate command history up"""
         if self.history and self.history_index > 0:
             self.history_index -= 1
-            self.terminal.delete('prompt_end', 'end-1c')
-            self.terminal.insert('prompt_end', self.history[self.history_index])
+            self._show_history_entry()
         return 'break'
 
     def history_down(self, event):
         """Navigate command history down"""
         if self.history_index < len(self.history) - 1:
             self.history_index += 1
-            self.terminal.delete('prompt_end', 'end-1c')
-            self.terminal.insert('prompt_end', self.history[self.history_index])
+            self._show_history_entry()
         return 'break'
 
+    def _show_history_entry(self):
+        """Put the current history entry after the prompt"""
+        entry = self.history[self.history_index]
+        # Repeated commands are common in history; when the line already
+        # holds this entry, one get beats a delete and an insert
+        if self.terminal.get('prompt_end', 'end-1c') != entry:
+            self.terminal.delete('prompt_end', 'end-1c')
+            self.terminal.insert('prompt_end', entry)
+
 class FileManager(Window):
     """File Manager application"""
+    # Lower-case extension -> list icon; anything else gets the plain file icon
+    _EXT_ICONS = {
+        **dict.fromkeys(('nes', 'smc', 'sfc', 'gb', 'gbc', 'gba', 'n64', 'z64'), '🎮'),
+        **dict.fromkeys(('png', 'jpg', 'jpeg', 'gif', 'bmp'), '🖼️'),
+        **dict.fromkeys(('mp3', 'wav', 'ogg', 'flac'), '🎵'),
+        **dict.fromkeys(('mp4', 'avi', 'mkv', 'webm'), '🎬'),
+        **dict.fromkeys(('py', 'js', 'html', 'css', 'c', 'cpp', 'java'), '💻'),
+        **dict.fromkeys(('txt', 'md', 'log', 'ini', 'cfg'), '📝'),
+    }
+    
     def __init__(self, parent, fs, initial_path='/home/user'):
         super().__init__(parent, "📁 File Manager", 600, 400)
         self.fs = fs
         self.current_path = initial_path
         self.selected_item = None
+        self._entries = []  # VFS node for each listbox row, in row order
         
         # Toolbar
         toolbar = Frame(self.content_frame, bg='#e0e0e0', height=30)
@@ -383,6 +591,13 @@ class FileManager(Window):
         self.file_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.file_listbox.yview)
         
+        # Context menu, built once and popped up on every right-click
+        self._ctx_menu = Menu(self.window, tearoff=0)
+        self._ctx_menu.add_command(label="Open", command=self.open_item)
+        self._ctx_menu.add_command(label="Delete", command=self.delete_selected)
+        self._ctx_menu.add_separator()
+        self._ctx_menu.add_command(label="Refresh", command=self.refresh_list)
+        
         # Bindings
         self.file_listbox.bind('<Double-Button-1>', self.open_item)
         self.file_listbox.bind('<<ListboxSelect>>', self.on_select)
@@ -393,44 +608,39 @@ class FileManager(Window):
     def refresh_list(self):
         """Refresh file list"""
         self.file_listbox.delete(0, tk.END)
-        items = self.fs.list_directory(self.current_path)
+        # Directories first, then files, each already sorted by the VFS
+        dirs, files = self.fs.sorted_listing(self.current_path)
+        self._entries = [*dirs, *files]
         
-        if not items:
+        if not self._entries:
             self.file_listbox.insert(tk.END, "[Empty folder]")
             return
         
-        # Sort directories first, then files
-        dirs = [item for item in items if item['type'] == 'directory']
-        files = [item for item in items if item['type'] == 'file']
-        
-        for item in sorted(dirs, key=lambda x: x['name']):
+        for item in dirs:
             self.file_listbox.insert(tk.END, f"📁 {item['name']}")
             
-        for item in sorted(files, key=lambda x: x['name']):
+        for item in files:
             icon = self.get_file_icon(item)
             size = self.format_size(item.get('size', 0))
             self.file_listbox.insert(tk.END, f"{icon} {item['name']} ({size})")
 
+    def selected_entry(self):
+        """VFS node of the selected row, or None (no selection, empty folder)"""
+        selection = self.file_listbox.curselection()
+        if selection and selection[0] < len(self._entries):
+            return self._entries[selection[0]]
+        return None
+
     def get_file_icon(self, file):
         """Get icon for file type"""
-        name = file['name'].lower()
-        if name.endswith(('.nes', '.smc', '.sfc', '.gb', '.gbc', '.gba', '.n64', '.z64')):
-            return '🎮'
-        elif name.endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
-            return '🖼️'
-        elif name.endswith(('.mp3', '.wav', '.ogg', '.flac')):
-            return '🎵'
-        elif name.endswith(('.mp4', '.avi', '.mkv', '.webm')):
-            return '🎬'
-        elif name.endswith(('.py', '.js', '.html', '.css', '.c', '.cpp', '.java')):
-            return '💻'
-        elif name.endswith(('.txt', '.md', '.log', '.ini', '.cfg')):
-            return '📝'
-        else:
-            return '📄'
+        name = file['name']
+        ext = name.rsplit('.', 1)[-1].lower() if '.' in name else ''
+        return self._EXT_ICONS.get(ext, '📄')
 
-    def format_size(self, size):
-        """Format file size"""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def format_size(size):
+        """Format file size (memoised: most files share a handful of sizes)"""
         if size < 1024:
             return f"{size} B"
         elif size < 1024 * 1024:
@@ -441,56 +651,44 @@ class FileManager(Window):
     def navigate_up(self):
         """Navigate to parent directory"""
         if self.current_path != '/':
-            parts = self.current_path.split('/')
-            if len(parts) > 2:
-                self.current_path = '/'.join(parts[:-1])
-            else:
-                self.current_path = '/'
+            self.current_path = self.fs.join(self.current_path, '..')
             self.path_var.set(self.current_path)
             self.refresh_list()
 
     def open_item(self, event=None):
         """Open selected item"""
-        selection = self.file_listbox.curselection()
-        if not selection:
-            return
-            
-        item_text = self.file_listbox.get(selection[0])
-        if item_text == "[Empty folder]":
+        entry = self.selected_entry()
+        if entry is None:
             return
             
-        # Extract name from display text
-        if item_text.startswith('📁'):
-            name = item_text[2:].strip()
-            self.current_path = f"{self.current_path}/{name}".replace('//', '/')
+        name = entry['name']
+        if entry['type'] == 'directory':
+            self.current_path = self.fs.join(self.current_path, name)
             self.path_var.set(self.current_path)
             self.refresh_list()
         else:
-            # Extract filename (remove icon and size)
-            parts = item_text.split(' ')
-            if len(parts) >= 2:
-                name = ' '.join(parts[1:]).rsplit(' (', 1)[0]
-                self.open_file(name)
+            self.open_file(name)
 
     def open_file(self, name):
         """Open a file with appropriate application"""
+        # ROMs are handed over by path; the emulator reads them when played
+        if name.lower().endswith(('.nes', '.smc', '.sfc', '.gb', '.gbc', '.gba', '.n64', '.z64')):
+            Emulator.open(self.parent, name, self.fs, self.current_path)
+            return
+        
         content = self.fs.read_file(self.current_path, name)
         if content is None:
             return
             
         # Determine file type and open appropriate app
-        if name.lower().endswith(('.nes', '.smc', '.sfc', '.gb', '.gbc', '.gba', '.n64', '.z64')):
-            Emulator(self.parent, name, content)
-        elif name.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
-            ImageViewer(self.parent, name, content)
+        if name.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
+            ImageViewer.open(self.parent, name, content)
         else:
             TextEditor(self.parent, self.fs, self.current_path, name, content)
 
     def on_select(self, event):
         """Handle item selection"""
-        selection = self.file_listbox.curselection()
-        if selection:
-            self.selected_item = self.file_listbox.get(selection[0])
+        self.selected_item = self.selected_entry()
 
     def create_folder(self):
         """Create new folder"""
@@ -543,13 +741,10 @@ class FileManager(Window):
                 # Determine file type
                 mime_type, _ = mimetypes.guess_type(filepath)
                 
-                # Read file content
-                if mime_type and mime_type.startswith('text'):
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                else:
-                    with open(filepath, 'rb') as f:
-                        content = f.read()
+                # Read file content as raw bytes, even for text: it is only
+                # decoded if it is opened, and large ROMs are not copied twice
+                with open(filepath, 'rb') as f:
+                    content = f.read()
                 
                 # Determine virtual file type
                 if name.lower().endswith(('.nes', '.smc', '.gb', '.gba', '.n64')):
@@ -569,40 +764,21 @@ class FileManager(Window):
 
     def delete_selected(self):
         """Delete selected item"""
-        selection = self.file_listbox.curselection()
-        if not selection:
+        entry = self.selected_entry()
+        if entry is None:
             return
             
-        item_text = self.file_listbox.get(selection[0])
-        if item_text == "[Empty folder]":
-            return
-            
-        # Extract name
-        if item_text.startswith('📁'):
-            name = item_text[2:].strip()
-        else:
-            parts = item_text.split(' ')
-            if len(parts) >= 2:
-                name = ' '.join(parts[1:]).rsplit(' (', 1)[0]
-            else:
-                return
-        
+        name = entry['name']
         if messagebox.askyesno("Delete", f"Delete '{name}'?"):
             if self.fs.delete_item(self.current_path, name):
                 self.refresh_list()
 
     def show_context_menu(self, event):
         """Show context menu"""
-        menu = Menu(self.window, tearoff=0)
-        menu.add_command(label="Open", command=self.open_item)
-        menu.add_command(label="Delete", command=self.delete_selected)
-        menu.add_separator()
-        menu.add_command(label="Refresh", command=self.refresh_list)
-        
         try:
-            menu.tk_popup(event.x_root, event.y_root)
+            self._ctx_menu.tk_popup(event.x_root, event.y_root)
         finally:
-            menu.grab_release()
+            self._ctx_menu.grab_release()
 
 class TextEditor(Window):
     """Text Editor application"""
@@ -636,12 +812,15 @@ class TextEditor(Window):
         scrollbar.config(command=self.text_area.yview)
         
         # Insert content
-        if isinstance(content, bytes):
+        text = as_text(content)
+        if text is None:
             self.text_area.insert('1.0', "[Binary file - cannot edit]")
             self.text_area.config(state='disabled')
         else:
-            self.text_area.insert('1.0', content)
+            self.text_area.insert('1.0', text)
             self.text_area.bind('<Key>', self.on_modify)
+        # Only edits made after this point make save_file re-encode the buffer
+        self.text_area.edit_modified(False)
 
     def on_modify(self, event=None):
         """Mark as modified"""
@@ -654,11 +833,15 @@ class TextEditor(Window):
         if self.text_area['state'] == 'disabled':
             return
             
-        content = self.text_area.get('1.0', 'end-1c')
         dir_node = self.fs.navigate(self.path)
-        if dir_node and dir_node.get('children') and self.filename in dir_node['children']:
-            dir_node['children'][self.filename]['content'] = content
-            dir_node['children'][self.filename]['size'] = len(content)
+        children = dir_node.get('children') if dir_node else None
+        if children and self.filename in children:
+            if self.text_area.edit_modified():
+                file_node = children[self.filename]
+                content = bytearray(self.text_area.get('1.0', 'end-1c').encode('utf-8'))
+                file_node['content'] = content
+                file_node['size'] = len(content)
+                self.text_area.edit_modified(False)
             self.modified = False
             self.window.title(f"📝 Text Editor - {self.filename}")
             messagebox.showinfo("Save", "File saved successfully!")
@@ -692,22 +875,67 @@ class TextEditor(Window):
 
 class ImageViewer(Window):
     """Image Viewer application"""
+    _instance = None
+    
+    @classmethod
+    def open(cls, parent, filename, content):
+        """Show an image in the shared viewer, creating it only if none is open"""
+        viewer = cls._instance
+        if viewer is None or viewer.parent is not parent or not viewer.is_open():
+            cls._instance = cls(parent, filename, content)
+        else:
+            viewer.show(filename, content)
+        return cls._instance
+    
     def __init__(self, parent, filename, content):
         super().__init__(parent, f"🖼️ Image Viewer - {filename}", 600, 400)
         
-        Label(self.content_frame, text=f"Image: {filename}",
-              font=('Arial', 14)).pack(pady=20)
+        self.name_label = Label(self.content_frame, text=f"Image: {filename}",
+                                font=('Arial', 14))
+        self.name_label.pack(pady=20)
         Label(self.content_frame, text="[Image display not implemented in tkinter version]",
               fg='gray').pack(pady=50)
         
         # In a real implementation, you would decode and display the image
 
+    def show(self, filename, content):
+        """Swap the viewer over to another image"""
+        self.retitle(f"🖼️ Image Viewer - {filename}")
+        self.name_label.config(text=f"Image: {filename}")
+
 class Emulator(Window):
     """ROM Emulator application"""
-    def __init__(self, parent, rom_name, rom_content):
+    _SYSTEMS = {
+        'nes': 'Nintendo Entertainment System',
+        'smc': 'Super Nintendo',
+        'sfc': 'Super Famicom', 
+        'gb': 'Game Boy',
+        'gbc': 'Game Boy Color',
+        'gba': 'Game Boy Advance',
+        'n64': 'Nintendo 64',
+        'z64': 'Nintendo 64'
+    }
+    _instance = None
+    
+    @classmethod
+    def open(cls, parent, rom_name, fs, path):
+        """Load a ROM into the idle emulator window, or a new one if it is busy"""
+        emu = cls._instance
+        # A paused or reset game still holds its ROM; only a never-played or
+        # stopped window is free to take another one
+        if (emu is None or emu.parent is not parent or emu.running
+                or emu.rom_content is not None or not emu.is_open()):
+            cls._instance = cls(parent, rom_name, fs, path)
+        else:
+            emu.load(rom_name, path)
+        return cls._instance
+    
+    def __init__(self, parent, rom_name, fs, path):
         super().__init__(parent, f"🎮 RetroArch - {rom_name}", 600, 400)
         self.rom_name = rom_name
-        self.rom_content = rom_content
+        self.fs = fs
+        self.path = path
+        self.rom_content = None  # Read from fs on the first start_emulation
         self.running = False
         
         # Emulator screen
@@ -736,23 +964,28 @@ class Emulator(Window):
         self.status = Label(controls, text="Ready", bg='#202020', fg='white')
         self.status.pack(side=tk.RIGHT, padx=10)
 
+    def load(self, rom_name, path):
+        """Swap a different ROM into this (stopped) emulator"""
+        self.rom_name = rom_name
+        self.path = path
+        self.rom_content = None
+        self.retitle(f"🎮 RetroArch - {rom_name}")
+        self.display.config(text=f"🎮\n\nROM Loaded: {rom_name}\n\nSystem: {self.get_system()}\n\nPress PLAY to start")
+        self.status.config(text="Ready")
+
     def get_system(self):
         """Determine emulated system from ROM extension"""
-        ext = self.rom_name.lower().split('.')[-1]
-        systems = {
-            'nes': 'Nintendo Entertainment System',
-            'smc': 'Super Nintendo',
-            'sfc': 'Super Famicom', 
-            'gb': 'Game Boy',
-            'gbc': 'Game Boy Color',
-            'gba': 'Game Boy Advance',
-            'n64': 'Nintendo 64',
-            'z64': 'Nintendo 64'
-        }
-        return systems.get(ext, 'Unknown System')
+        ext = self.rom_name.lower().rsplit('.', 1)[-1]
+        return self._SYSTEMS.get(ext, 'Unknown System')
 
     def start_emulation(self):
         """Start emulation simulation"""
+        if self.rom_content is None:
+            self.rom_content = self.fs.read_file(self.path, self.rom_name)
+            if self.rom_content is None:
+                self.status.config(text="Error")
+                self.display.config(text=f"⚠️ ROM NOT FOUND\n\n{self.rom_name}")
+                return
         self.running = True
         self.status.config(text="Running")
         self.display.config(text=f"🎮 EMULATING\n\n{self.rom_name}\n\n[Simulation Mode]\n\nFPS: 60")
@@ -772,6 +1005,7 @@ class Emulator(Window):
     def stop_emulation(self):
         """Stop emulation"""
         self.running = False
+        self.rom_content = None  # Re-read on the next start
         self.status.config(text="Stopped")
         self.display.config(text=f"⏹️ STOPPED\n\n{self.rom_name}\n\nPress PLAY to start")
 
@@ -856,9 +1090,8 @@ class Switch2Mode(Window):
                 rom_text = rom_listbox.get(selection[0])
                 if rom_text.startswith('🎮'):
                     rom_name = rom_text[2:].strip()
-                    content = self.fs.read_file(rom_path, rom_name)
-                    if content:
-                        Emulator(self.parent, rom_name, content)
+                    if self.fs.read_file(rom_path, rom_name):
+                        Emulator.open(self.parent, rom_name, self.fs, rom_path)
         
         Button(retroarch_window.content_frame, text="Load ROM",
                command=load_rom).pack(pady=10)
@@ -1009,11 +1242,16 @@ class GNUKoopaOS:
         canvas = Canvas(desktop, bg='#4a4a4a', highlightthickness=0)
         canvas.pack(fill=tk.BOTH, expand=True)
         
-        # Create crosshatch pattern
-        for i in range(0, 1024, 4):
-            canvas.create_line(i, 0, i, 768, fill='#5a5a5a', width=1)
-        for i in range(0, 768, 4):
-            canvas.create_line(0, i, 1024, i, fill='#5a5a5a', width=1)
+        # Create crosshatch pattern: one 4x4 tile (line colour along its top
+        # row and left column) that Tk replicates over the whole image in a
+        # single put, instead of hundreds of canvas line items. Kept on self
+        # so the image is not garbage collected while shown.
+        line, bg = '#5a5a5a', '#4a4a4a'
+        tile = ' '.join('{' + ' '.join(line if x == 0 or y == 0 else bg for x in range(4)) + '}'
+                        for y in range(4))
+        self.desktop_bg = tk.PhotoImage(master=canvas, width=1024, height=768)
+        self.desktop_bg.put(tile, to=(0, 0, 1024, 768))
+        canvas.create_image(0, 0, image=self.desktop_bg, anchor='nw')
         
         # Desktop text
         canvas.create_text(512, 300, text="GNU/Koopa", fill='#333333',
@@ -1,11 +1,13 @@
 from ursina import *
 import random
+import math
 
-app = Ursina()
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; player_step then runs as plain Python
+    njit = None
 
-# Define clamp function (not built-in in Ursina or standard Python for this purpose)
-def clamp(value, min_val, max_val):
-    return max(min_val, min(value, max_val))
+app = Ursina()
 
 # Camera setup
 camera.fov = 90  # Perspective projection for 3D
@@ -13,6 +15,24 @@ camera.position = (5, 5, -15)  # Initial position behind player
 camera.rotation = (15, -30, 0)  # Slight tilt for better view
 camera.smoothness = 5  # Controls camera follow speed
 
+# Per-frame player physics on plain floats, so it can be compiled by Numba
+def player_step(y, velocity_y, x, z, ax, az, speed, gravity, dt):
+    """Gravity plus a clamped WASD move for one frame.
+    (ax, az) is the raw input direction; it is normalised here.
+    Returns (y, velocity_y, x, z).
+    """
+    velocity_y -= gravity * dt
+    y += velocity_y * dt
+    length = math.sqrt(ax * ax + az * az)
+    if length > 0:
+        step = speed * dt / length
+        x += ax * step
+        z += az * step
+    return y, velocity_y, max(-25.0, min(x, 25.0)), max(-25.0, min(z, 25.0))
+
+if njit is not None:
+    player_step = njit(cache=True)(player_step)
+
 # Player setup
 class Player(Entity):
     def __init__(self, **kwargs):
@@ -24,30 +44,25 @@ class Player(Entity):
         self.grounded = False
 
     def update(self):
-        # Gravity and vertical movement
-        self.velocity_y -= self.gravity * time.dt
-        self.y += self.velocity_y * time.dt
+        # Gravity, vertical movement, horizontal movement (WASD or arrows)
+        # and the bounds clamp all happen in player_step
+        x, z = self.x, self.z
+        y, self.velocity_y, new_x, new_z = player_step(
+            self.y, self.velocity_y, x, z,
+            held_keys['d'] - held_keys['a'] + held_keys['right arrow'] - held_keys['left arrow'],
+            held_keys['w'] - held_keys['s'] + held_keys['up arrow'] - held_keys['down arrow'],
+            self.speed, self.gravity, time.dt)
 
-        # Ground check (simple raycast downward)
-        ray = raycast(self.position, direction=(0, -1, 0), distance=0.6, ignore=[self])
+        # Ground check (simple raycast downward, from before the horizontal move)
+        ray = raycast(Vec3(x, y, z), direction=(0, -1, 0), distance=0.6, ignore=[self])
         if ray.hit:
-            self.y = ray.world_point.y + 0.5  # Adjust to ground level
+            y = ray.world_point.y + 0.5  # Adjust to ground level
             self.velocity_y = 0
             self.grounded = True
         else:
             self.grounded = False
 
-        # Horizontal movement (WASD or arrows)
-        direction = Vec3(
-            held_keys['d'] - held_keys['a'] + held_keys['right arrow'] - held_keys['left arrow'],
-            0,
-            held_keys['w'] - held_keys['s'] + held_keys['up arrow'] - held_keys['down arrow']
-        ).normalized() * self.speed
-        self.position += direction * time.dt
-
-        # Keep player within bounds
-        self.x = clamp(self.x, -25, 25)
-        self.z = clamp(self.z, -25, 25)
+        self.position = Vec3(new_x, y, new_z)
 
     def input(self, key):
         if key == 'space' and self.grounded:
@@ -92,17 +107,31 @@ flag = Entity(model='cube', scale=(1, 2, 1), position=(30, -3, 0), color=color.b
 # Text (positioned in screen space)
 score = 0
 score_text = Text(text=f'Score: {score}', position=(-0.8, 0.4), origin=(0, 0))
+shown_text = score_text.text
+
+def show_score(text):
+    """Set score_text, skipping the text rebuild when it already shows text"""
+    global shown_text
+    if text != shown_text:
+        score_text.text = text
+        shown_text = text
 
 # Update function
 def update():
     global score
-    # Coin collection
-    for coin in coins[:]:
+    # Coin collection; a collected coin is swap-removed (the last coin takes
+    # its slot and is checked next) instead of copying and searching the list
+    i = 0
+    while i < len(coins):
+        coin = coins[i]
         if player.intersects(coin).hit:
-            coins.remove(coin)
+            coins[i] = coins[-1]
+            coins.pop()
             destroy(coin)
             score += 10
-            score_text.text = f'Score: {score}'
+            show_score(f'Score: {score}')
+        else:
+            i += 1
 
     # Enemy movement (patrol along x-axis)
     for enemy in enemies:
@@ -118,11 +147,11 @@ def update():
         if player.intersects(enemy).hit:
             player.position = (0, 0, 0)  # Reset to start
             score = 0
-            score_text.text = f'Score: {score}'
+            show_score(f'Score: {score}')
 
     # Win condition
     if player.intersects(flag).hit:
-        score_text.text = f'WIN! Score: {score}'
+        show_score(f'WIN! Score: {score}')
 
     # Camera follows player (Mario 64-style third-person)
     target_pos = player.position + Vec3(5, 5, -10)  # Offset behind and above
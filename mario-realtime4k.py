@@ -47,7 +47,7 @@ def make_sprite(pixels, cmap):
         for x,ch in enumerate(row):
             if ch != ".":
                 pygame.draw.rect(surf,cmap.get(ch,BLACK),(x,y,1,1))
-    return pygame.transform.scale(surf,(TILE,TILE))
+    return pygame.transform.scale(surf,(TILE,TILE)).convert_alpha()
 
 color_map = {"R":RED,"Y":YELLOW,"S":SKIN,"B":BLUE}
 mario_sprite = make_sprite(MARIO_PIXELS,color_map)
@@ -97,6 +97,25 @@ TILE_MAP = {
     "F": GREEN,   # flagpole
 }
 
+# Solid tiles, pre-rendered once per colour and bucketed by column so the
+# draw loop only visits the columns on screen; solid_cells is the same set
+# of tiles keyed by (col,row) for collision lookups
+def make_tile(color):
+    surf = pygame.Surface((TILE,TILE))
+    surf.fill(color)
+    pygame.draw.rect(surf,BLACK,surf.get_rect(),1)
+    return surf.convert()
+
+tile_surfs = {color: make_tile(color) for color in {*TILE_MAP.values(), BROWN}}
+tiles_by_col = [[] for _ in range(max(len(line) for line in level))]
+solid_cells = set()
+for row,line in enumerate(level):
+    for col,tile in enumerate(line):
+        if tile!=".":
+            tiles_by_col[col].append((tile_surfs[TILE_MAP.get(tile,BROWN)],col*TILE,row*TILE))
+            solid_cells.add((col,row))
+tile_rect = pygame.Rect(0,0,TILE,TILE)  # reused for every collision test
+
 # Player
 player = pygame.Rect(32, 120, TILE, TILE)
 vel_y = 0
@@ -105,6 +124,9 @@ JUMP = -10
 on_ground = True
 speed = 2
 
+# Held keys, kept up to date from KEYDOWN/KEYUP events
+held_left = held_right = held_jump = False
+
 # Goombas
 goombas = [pygame.Rect(200, 192, TILE, TILE)]
 goomba_dir = {id(g): -1 for g in goombas}
@@ -117,71 +139,76 @@ while running:
     for e in pygame.event.get():
         if e.type==pygame.QUIT:
             running=False
-
-    keys=pygame.key.get_pressed()
-    if keys[pygame.K_LEFT]:
-        player.x-=speed
-    if keys[pygame.K_RIGHT]:
-        player.x+=speed
-    if keys[pygame.K_SPACE] and on_ground:
+        elif e.type in (pygame.KEYDOWN, pygame.KEYUP):
+            down = e.type==pygame.KEYDOWN
+            if e.key==pygame.K_LEFT:
+                held_left=down
+            elif e.key==pygame.K_RIGHT:
+                held_right=down
+            elif e.key==pygame.K_SPACE:
+                held_jump=down
+
+    player.x+=(held_right-held_left)*speed
+    if held_jump and on_ground:
         vel_y=JUMP
 
     # Apply gravity
     vel_y+=GRAVITY
     player.y+=vel_y
 
-    # Collisions
+    # Collisions: only the grid cells the player overlaps can hold a tile
     on_ground=False
-    for row in range(len(level)):
-        for col in range(len(level[row])):
-            tile=level[row][col]
-            if tile!=".":
-                rect=pygame.Rect(col*TILE,row*TILE,TILE,TILE)
-                if player.colliderect(rect) and vel_y>0:
-                    player.bottom=rect.top
+    for row in range(player.top//TILE,(player.bottom-1)//TILE+1):
+        for col in range(player.left//TILE,(player.right-1)//TILE+1):
+            if (col,row) in solid_cells:
+                tile_rect.update(col*TILE,row*TILE,TILE,TILE)
+                if player.colliderect(tile_rect) and vel_y>0:
+                    player.bottom=tile_rect.top
                     vel_y=0
                     on_ground=True
 
-    # Goomba movement
-    for g in goombas:
+    # Goomba movement; stomped goombas are swap-removed (the last one takes
+    # their slot and is handled next), so no goomba is skipped for the frame
+    i = 0
+    while i < len(goombas):
+        g = goombas[i]
         g.x += goomba_dir[id(g)]
-        # bounce off blocks
-        for row in range(len(level)):
-            for col in range(len(level[row])):
-                tile=level[row][col]
-                if tile!=".":
-                    rect=pygame.Rect(col*TILE,row*TILE,TILE,TILE)
-                    if g.colliderect(rect):
+        # bounce off blocks (a bounce nudges it 2px, so check a column
+        # either side of the cells it overlaps as well)
+        for row in range(g.top//TILE,(g.bottom-1)//TILE+1):
+            for col in range(g.left//TILE-1,(g.right-1)//TILE+2):
+                if (col,row) in solid_cells:
+                    tile_rect.update(col*TILE,row*TILE,TILE,TILE)
+                    if g.colliderect(tile_rect):
                         goomba_dir[id(g)]*=-1
                         g.x+=goomba_dir[id(g)]*2
 
         # Mario stomp
         if player.colliderect(g):
             if vel_y>0: # stomped
-                goombas.remove(g)
+                del goomba_dir[id(g)]
+                goombas[i] = goombas[-1]
+                goombas.pop()
+                continue
             else:
                 print("Game Over")
                 running=False
+        i += 1
 
     # Camera follows Mario
     camera_x = max(0, player.x - WIDTH//2)
 
     # Draw
     screen.fill(BLUE)
-    for row in range(len(level)):
-        for col in range(len(level[row])):
-            tile=level[row][col]
-            if tile!=".":
-                rect=pygame.Rect(col*TILE-camera_x,row*TILE,TILE,TILE)
-                pygame.draw.rect(screen,TILE_MAP.get(tile,BROWN),rect)
-                pygame.draw.rect(screen,BLACK,rect,1)
-
-    # Draw goombas
-    for g in goombas:
-        screen.blit(goomba_sprite,(g.x-camera_x,g.y))
-
-    # Draw Mario
-    screen.blit(mario_sprite,(player.x-camera_x,player.y))
+    first_col = camera_x//TILE
+    screen.blits([(surf,(x-camera_x,y))
+                  for column in tiles_by_col[first_col:(camera_x+WIDTH)//TILE+1]
+                  for surf,x,y in column], False)
+
+    # Draw goombas, then Mario on top, in one blits call
+    sprites = [(goomba_sprite,(g.x-camera_x,g.y)) for g in goombas]
+    sprites.append((mario_sprite,(player.x-camera_x,player.y)))
+    screen.blits(sprites, False)
 
     pygame.display.flip()
     clock.tick(FPS)